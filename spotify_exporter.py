@@ -5,26 +5,39 @@ An advanced application for exporting Spotify playlists
 import sys
 import json
 import csv
+import gzip
 import os
 import re
+import time
 import logging
 from pathlib import Path
 from datetime import datetime
-from typing import Optional, List, Dict, Any
-from dataclasses import dataclass
+from typing import TYPE_CHECKING, Optional, List, Dict, Set, Sequence, Any, NamedTuple, Tuple
+from dataclasses import dataclass, field
 from enum import Enum
+from collections import deque
+from concurrent.futures import ThreadPoolExecutor
+from functools import lru_cache
+from operator import attrgetter
 
-import requests
-import spotipy
-from spotipy.oauth2 import SpotifyOAuth
 import configparser
 
+if TYPE_CHECKING:
+    import requests
+    import spotipy
+
+try:
+    import orjson
+except ImportError:  # optional, export_to_json falls back to the stdlib encoder
+    orjson = None
+
 from PyQt6.QtWidgets import (
     QApplication, QMainWindow, QWidget, QVBoxLayout, QHBoxLayout,
     QLabel, QMessageBox, QFileDialog, QStatusBar,
     QDialog, QTabWidget, QListWidgetItem,
-    QSizePolicy, QGroupBox, QGraphicsDropShadowEffect, QScrollArea, QFrame,
-    QPushButton, QLineEdit, QListWidget, QProgressBar, QCheckBox, QComboBox
+    QSizePolicy, QGroupBox, QScrollArea, QFrame,
+    QPushButton, QLineEdit, QListWidget, QProgressBar, QCheckBox, QComboBox,
+    QSplashScreen
 )
 from qfluentwidgets import (
     PushButton, PrimaryPushButton, LineEdit, PasswordLineEdit,
@@ -33,11 +46,11 @@ from qfluentwidgets import (
 )
 from PyQt6.QtCore import (
     Qt, QThread, pyqtSignal, QPoint, QSize, QSettings, QPropertyAnimation,
-    QEasingCurve, QRect
+    QEasingCurve, QRect, QTimer, QItemSelection, QItemSelectionModel
 )
 from PyQt6.QtGui import (
     QFont, QColor, QIcon, QPainter, QPainterPath, QLinearGradient,
-    QMouseEvent, QCursor
+    QMouseEvent, QCursor, QPixmap
 )
 
 
@@ -50,6 +63,41 @@ class Constants:
     REDIRECT_URI = "http://127.0.0.1:8888/callback"
     SPOTIFY_SCOPE = "playlist-read-private playlist-read-collaborative"
     
+    # Number of playlists fetched concurrently during an export
+    PLAYLIST_FETCH_WORKERS = 4
+    # Playlists fetched ahead of the one being written, bounding how many
+    # fetched track lists are held in memory at once
+    PLAYLIST_LOOKAHEAD = PLAYLIST_FETCH_WORKERS + 1
+    # Requests in flight across all playlists of an export, kept within
+    # spotipy's default pool of 10 connections
+    PAGE_FETCH_WORKERS = 8
+    TRACK_PAGE_SIZE = 100
+    # Playlist pages fetched concurrently while loading the library
+    PLAYLIST_PAGE_WORKERS = 4
+    PLAYLIST_PAGE_SIZE = 50
+    # Playlist library cached on disk between launches
+    PLAYLIST_CACHE_FILE = Path.home() / '.spotify-exporter' / 'playlists.json'
+    PLAYLIST_CACHE_TTL = 600
+    
+    # Keystrokes within this window are filtered in a single pass
+    SEARCH_DEBOUNCE_MS = 150
+    # Only request the track attributes that end up in an export
+    TRACK_FIELDS = (
+        "total,items(track(name,id,duration_ms,external_urls.spotify,"
+        "artists(name),album(name)))"
+    )
+    
+    # Discord webhooks allow roughly 5 requests per 2 seconds; the interval
+    # is only used when a response carries no rate limit headers
+    DISCORD_POST_INTERVAL = 0.4
+    DISCORD_TIMEOUT = 10
+    DISCORD_MAX_RETRIES = 5
+    # Stay well under Discord's 2000 character message limit
+    DISCORD_MESSAGE_LIMIT = 1800
+    
+    # Export files are written through a 1 MiB buffer to cut write() syscalls
+    WRITE_BUFFER_SIZE = 1024 * 1024
+    
     # Modern Color Palette
     PRIMARY = "#1DB954"
     PRIMARY_HOVER = "#1ed760"
@@ -89,10 +137,91 @@ class ExportFormat(Enum):
         self.color = color
 
 
+# ==================== Styling ====================
+def build_stylesheet() -> str:
+    """Build the application-wide stylesheet from the Constants palette"""
+    # One rule per export format, matched on the indicator's 'format' property
+    format_indicators = "".join(
+        f"""
+        QFrame#FormatIndicator[format="{fmt.value}"] {{
+            background-color: {fmt.color};
+        }}"""
+        for fmt in ExportFormat
+    )
+    return f"""
+        MainWindow, SettingsDialog {{
+            background-color: {Constants.BACKGROUND};
+        }}
+        LoginWindow {{
+            background-color: {Constants.BACKGROUND};
+            border: 1px solid {Constants.BORDER};
+            border-radius: 8px;
+        }}
+        MainWindow QLabel, SettingsDialog QLabel, LoginWindow QLabel {{
+            color: {Constants.TEXT_PRIMARY};
+        }}
+        QLabel#SecondaryLabel {{
+            color: {Constants.TEXT_SECONDARY};
+        }}
+        CustomTitleBar {{
+            background-color: {Constants.SURFACE};
+            border-bottom: 1px solid {Constants.BORDER};
+        }}
+        QLabel#VersionBadge {{
+            background-color: {Constants.PRIMARY};
+            color: white;
+            border-radius: 11px;
+            font-size: 9px;
+            font-weight: 600;
+            padding: 2px 8px;
+        }}
+        QPushButton#MinimizeButton, QPushButton#MaximizeButton,
+        QPushButton#CloseButton, QPushButton#DialogCloseButton {{
+            background-color: transparent;
+            color: {Constants.TEXT_SECONDARY};
+            border: none;
+            font-size: 18px;
+            font-weight: bold;
+            border-radius: 6px;
+        }}
+        QPushButton#DialogCloseButton {{
+            font-size: 28px;
+        }}
+        QPushButton#MinimizeButton:hover {{
+            background-color: {Constants.INFO};
+            color: white;
+        }}
+        QPushButton#MaximizeButton:hover {{
+            background-color: {Constants.WARNING};
+            color: white;
+        }}
+        QPushButton#CloseButton:hover, QPushButton#DialogCloseButton:hover {{
+            background-color: {Constants.ERROR};
+            color: white;
+        }}
+        QStatusBar {{
+            background-color: {Constants.SURFACE};
+            color: {Constants.TEXT_SECONDARY};
+            border-top: 1px solid {Constants.BORDER};
+            padding: 8px 30px;
+        }}
+        QFrame#FormatIndicator {{
+            border-radius: 2px;
+        }}{format_indicators}
+    """
+
+
+@lru_cache(maxsize=None)
+def ui_font(size: int, bold: bool = False) -> QFont:
+    """Return a shared application font, built once per size/weight"""
+    if bold:
+        return QFont('Segoe UI', size, QFont.Weight.Bold)
+    return QFont('Segoe UI', size)
+
+
 # ==================== Data Classes ====================
-@dataclass
-class Track:
-    """Track data class"""
+class Track(NamedTuple):
+    """Track row, stored as a tuple so writers can consume it directly"""
     name: str
     artist: str
     album: str
@@ -100,13 +229,7 @@ class Track:
     url: str
     
     def to_dict(self) -> Dict[str, Any]:
-        return {
-            'name': self.name,
-            'artist': self.artist,
-            'album': self.album,
-            'duration_ms': self.duration_ms,
-            'url': self.url
-        }
+        return dict(zip(self._fields, self))
 
 
 @dataclass
@@ -117,42 +240,166 @@ class Playlist:
     track_count: int
     owner: str
     description: str = ""
+    # Changes whenever the playlist's tracks change
+    snapshot_id: str = ""
+    # Derived once here instead of on every list rebuild, sort and filter pass
+    name_lower: str = field(init=False, repr=False, compare=False)
+    display: str = field(init=False, repr=False, compare=False)
+    tooltip: str = field(init=False, repr=False, compare=False)
+    # Lowercased name, owner and description searched by the playlist filter
+    search_blob: str = field(init=False, repr=False, compare=False)
+    
+    def __post_init__(self):
+        self.name_lower = self.name.lower()
+        self.display = f"{self.name} • {self.track_count} tracks"
+        self.tooltip = (
+            f"Owner: {self.owner}\n"
+            f"Tracks: {self.track_count}\n"
+            f"Description: {self.description or 'No description'}"
+        )
+        # NUL separators keep a search from matching across two fields
+        self.search_blob = f"{self.name}\x00{self.owner}\x00{self.description}".lower()
+
+
+def _narrow_filter(playlists: List[Playlist], search_text: str, last_text: str,
+                   last_matches: Sequence[int]) -> Tuple[Sequence[int], List[int]]:
+    """Return the rows to re-test for search_text and the ones that match it"""
+    # Typing more of the same search can only narrow the result, so only
+    # the rows that matched last time need to be tested again
+    if last_text in search_text:
+        candidates = last_matches
+    else:
+        candidates = range(len(playlists))
+    return candidates, [i for i in candidates if search_text in playlists[i].search_blob]
 
 
 # ==================== Configuration Manager ====================
+_SPOTIFY_SECTION = re.compile(r'^\[SPOTIFY\][^\n]*\n?(.*?)(?=^\[|\Z)', re.MULTILINE | re.DOTALL)
+_CREDENTIAL_LINE = re.compile(r'^\s*(client_id|client_secret)\s*[=:]\s*(.*?)\s*$', re.MULTILINE)
+
+
 class ConfigManager:
     """Manages application configuration"""
     
+    # Shared by every instance so credentials saved from the login dialog
+    # are visible to the manager owned by main()
+    _credentials: Optional[Dict[str, str]] = None
+    
     def __init__(self):
-        self.config = configparser.ConfigParser()
         self.settings = QSettings('SpotifyExporter', 'Settings')
+        self._cache: Dict[str, Any] = {}
         
     def load_credentials(self) -> Optional[Dict[str, str]]:
-        if not Path(Constants.CONFIG_FILE).exists():
+        if ConfigManager._credentials is None:
+            ConfigManager._credentials = self._read_credentials()
+        return ConfigManager._credentials
+    
+    def _read_credentials(self) -> Optional[Dict[str, str]]:
+        config_path = Path(Constants.CONFIG_FILE)
+        if not config_path.exists():
             return None
-            
-        self.config.read(Constants.CONFIG_FILE, encoding='utf-8')
-        if 'SPOTIFY' not in self.config:
+        
+        # The file only holds the [SPOTIFY] section written by save_credentials,
+        # so a single regex pass is enough to read it back
+        section = _SPOTIFY_SECTION.search(config_path.read_text(encoding='utf-8'))
+        if not section:
             return None
             
+        values = dict(_CREDENTIAL_LINE.findall(section.group(1)))
         return {
-            'client_id': self.config['SPOTIFY'].get('client_id', ''),
-            'client_secret': self.config['SPOTIFY'].get('client_secret', '')
+            'client_id': values.get('client_id', ''),
+            'client_secret': values.get('client_secret', '')
         }
     
     def save_credentials(self, client_id: str, client_secret: str) -> None:
-        self.config['SPOTIFY'] = {
+        config = configparser.ConfigParser()
+        config['SPOTIFY'] = {
             'client_id': client_id,
             'client_secret': client_secret
         }
         with open(Constants.CONFIG_FILE, 'w', encoding='utf-8') as configfile:
-            self.config.write(configfile)
+            config.write(configfile)
+        ConfigManager._credentials = {
+            'client_id': client_id,
+            'client_secret': client_secret
+        }
+    
+    def clear_credentials(self) -> None:
+        Path(Constants.CONFIG_FILE).unlink(missing_ok=True)
+        ConfigManager._credentials = None
     
     def get_setting(self, key: str, default: Any = None) -> Any:
-        return self.settings.value(key, default)
+        # QSettings hits the registry/plist/ini on every read, so values are
+        # cached and only refreshed through set_setting
+        if key not in self._cache:
+            self._cache[key] = self.settings.value(key)
+        value = self._cache[key]
+        return default if value is None else value
+    
+    def get_bool_setting(self, key: str, default: bool = False) -> bool:
+        # INI and plist backends hand booleans back as 'true'/'false' strings
+        value = self.get_setting(key, default)
+        if isinstance(value, str):
+            return value.lower() == 'true'
+        return bool(value)
     
     def set_setting(self, key: str, value: Any) -> None:
+        if key in self._cache and self._cache[key] == value:
+            return
         self.settings.setValue(key, value)
+        self._cache[key] = value
+
+
+class PlaylistCache:
+    """On-disk cache of each user's playlist library"""
+    
+    def __init__(self, path: Path = Constants.PLAYLIST_CACHE_FILE,
+                 ttl: float = Constants.PLAYLIST_CACHE_TTL):
+        self.path = path
+        self.ttl = ttl
+        
+    def _read(self) -> Dict[str, Any]:
+        try:
+            data = json.loads(self.path.read_text(encoding='utf-8'))
+        except FileNotFoundError:
+            return {}
+        except (OSError, ValueError) as e:
+            logger.warning("Ignoring unreadable playlist cache: %s", e)
+            return {}
+        if not isinstance(data, dict):
+            logger.warning("Ignoring malformed playlist cache: %s", self.path)
+            return {}
+        return data
+    
+    def get(self, user_id: str) -> Optional[List[Playlist]]:
+        entry = self._read().get(user_id)
+        if not entry:
+            return None
+        # A hand-edited or half-written file must not break loading; it is
+        # treated as a miss and overwritten by the fresh fetch
+        try:
+            if time.time() - entry.get('saved_at', 0) > self.ttl:
+                return None
+            return [Playlist(*row) for row in entry['playlists']]
+        except (TypeError, ValueError, AttributeError, KeyError) as e:
+            logger.warning("Ignoring malformed playlist cache entry: %s", e)
+            return None
+    
+    def set(self, user_id: str, playlists: List[Playlist]) -> None:
+        data = self._read()
+        # Rows keep only the init fields; search_blob is rebuilt on load
+        data[user_id] = {
+            'saved_at': time.time(),
+            'playlists': [
+                (p.id, p.name, p.track_count, p.owner, p.description, p.snapshot_id)
+                for p in playlists
+            ]
+        }
+        try:
+            self.path.parent.mkdir(parents=True, exist_ok=True)
+            self.path.write_text(json.dumps(data, ensure_ascii=False), encoding='utf-8')
+        except OSError as e:
+            logger.warning("Failed to write playlist cache: %s", e)
 
 
 # ==================== Logger Setup ====================
@@ -165,7 +412,9 @@ def setup_logging():
         log_dir / f'spotify_exporter_{datetime.now():%Y%m%d}.log',
         encoding='utf-8'
     )
-    file_handler.setLevel(logging.INFO)
+    # e.g. SPOTIFY_EXPORTER_LOG_LEVEL=WARNING keeps routine export messages out of the log file
+    file_level = logging.getLevelName(os.environ.get('SPOTIFY_EXPORTER_LOG_LEVEL', 'INFO').upper())
+    file_handler.setLevel(file_level if isinstance(file_level, int) else logging.INFO)
     #debug stuff
     console_handler = logging.StreamHandler()
     console_handler.setLevel(logging.INFO)
@@ -206,28 +455,20 @@ class CustomTitleBar(QWidget):
         layout.setSpacing(15)
         
         self.title_label = QLabel(Constants.APP_NAME)
-        self.title_label.setFont(QFont('Segoe UI', 11, QFont.Weight.Bold))
-        self.title_label.setStyleSheet(f"color: {Constants.TEXT_PRIMARY};")
+        self.title_label.setFont(ui_font(11, bold=True))
         
         version_badge = QLabel(f"v{Constants.APP_VERSION}")
+        version_badge.setObjectName("VersionBadge")
         version_badge.setFixedSize(45, 22)
         version_badge.setAlignment(Qt.AlignmentFlag.AlignCenter)
-        version_badge.setStyleSheet(f"""
-            background-color: {Constants.PRIMARY};
-            color: white;
-            border-radius: 11px;
-            font-size: 9px;
-            font-weight: 600;
-            padding: 2px 8px;
-        """)
         
         layout.addWidget(self.title_label)
         layout.addWidget(version_badge)
         layout.addStretch()
         
-        self.minimize_btn = self.create_control_button("−", Constants.INFO)
-        self.maximize_btn = self.create_control_button("□", Constants.WARNING)
-        self.close_btn = self.create_control_button("×", Constants.ERROR)
+        self.minimize_btn = self.create_control_button("−", "MinimizeButton")
+        self.maximize_btn = self.create_control_button("□", "MaximizeButton")
+        self.close_btn = self.create_control_button("×", "CloseButton")
         
         self.minimize_btn.clicked.connect(self.parent_window.showMinimized)
         self.maximize_btn.clicked.connect(self.toggle_maximize)
@@ -237,31 +478,11 @@ class CustomTitleBar(QWidget):
         layout.addWidget(self.maximize_btn)
         layout.addWidget(self.close_btn)
         
-        self.setStyleSheet(f"""
-            CustomTitleBar {{
-                background-color: {Constants.SURFACE};
-                border-bottom: 1px solid {Constants.BORDER};
-            }}
-        """)
-        
-    def create_control_button(self, text: str, color: str) -> QPushButton:
+    def create_control_button(self, text: str, object_name: str) -> QPushButton:
         btn = QPushButton(text)
+        btn.setObjectName(object_name)
         btn.setFixedSize(40, 32)
         btn.setCursor(QCursor(Qt.CursorShape.PointingHandCursor))
-        btn.setStyleSheet(f"""
-            QPushButton {{
-                background-color: transparent;
-                color: {Constants.TEXT_SECONDARY};
-                border: none;
-                font-size: 18px;
-                font-weight: bold;
-                border-radius: 6px;
-            }}
-            QPushButton:hover {{
-                background-color: {color};
-                color: white;
-            }}
-        """)
         return btn
     
     def toggle_maximize(self):
@@ -298,7 +519,8 @@ class Card(SimpleCardWidget):
         self.setup_style()
         
     def setup_style(self):
-        # Additional custom style if needed, SimpleCardWidget already handles most
+        # Additional custom style if needed, SimpleCardWidget already handles most.
+        # Avoid QGraphicsEffect shadows here: they force software-rendered repaints.
         pass
 
 class FormatButton(SimpleCardWidget):
@@ -322,18 +544,17 @@ class FormatButton(SimpleCardWidget):
         
         indicator = QFrame()
         indicator.setFixedSize(40, 4)
-        indicator.setStyleSheet(f"""
-            background-color: {self.format_type.color};
-            border-radius: 2px;
-        """)
+        # Colored by the app stylesheet, so no per-button sheet is parsed
+        indicator.setObjectName("FormatIndicator")
+        indicator.setProperty("format", self.format_type.value)
         
         name_label = QLabel(self.format_type.display_name)
-        name_label.setFont(QFont('Segoe UI', 12, QFont.Weight.Bold))
+        name_label.setFont(ui_font(12, bold=True))
         name_label.setAlignment(Qt.AlignmentFlag.AlignCenter)
         
         type_label = QLabel(f".{self.format_type.value}")
-        type_label.setFont(QFont('Segoe UI', 10))
-        type_label.setStyleSheet(f"color: {Constants.TEXT_SECONDARY};")
+        type_label.setFont(ui_font(10))
+        type_label.setObjectName("SecondaryLabel")
         type_label.setAlignment(Qt.AlignmentFlag.AlignCenter)
         
         layout.addWidget(indicator, alignment=Qt.AlignmentFlag.AlignCenter)
@@ -344,6 +565,44 @@ class FormatButton(SimpleCardWidget):
 
 
 # ==================== Export Worker ====================
+# Reserved filename characters and control characters, deleted with str.translate
+_FILENAME_DELETE_TABLE = dict.fromkeys(
+    [*range(0x00, 0x20), *range(0x7f, 0xa0), *map(ord, '<>:"/\\|?*')]
+)
+
+_UNKNOWN_TRACK = sys.intern('Unknown Track')
+_UNKNOWN_ARTIST = sys.intern('Unknown Artist')
+_UNKNOWN_ALBUM = sys.intern('Unknown Album')
+_SPOTIFY_URL = 'https://open.spotify.com'
+
+# Fixed pieces of the text exports. Per-track lines stay f-strings, which
+# CPython builds several times faster than str.format templates.
+_TXT_RULE = "=" * 80 + "\n\n"
+_MD_TRACKS_HEADING = "---\n\n## Tracks\n\n"
+_DISCORD_SEP = "─" * 40 + "\n\n"
+
+# Webhook bodies are encoded here rather than by requests on every post
+_JSON_HEADERS = {'Content-Type': 'application/json'}
+
+
+def _json_default(obj: Any) -> Any:
+    if isinstance(obj, Track):
+        return obj.to_dict()
+    raise TypeError(f"Object of type {type(obj).__name__} is not JSON serializable")
+
+
+def _header_seconds(value: Optional[str], default: float = 0.0) -> float:
+    try:
+        return float(value)
+    except (TypeError, ValueError):
+        return default
+
+
+def _now_stamps() -> Tuple[str, str, str]:
+    """Return (file, human, iso) timestamps taken from a single datetime.now()"""
+    now = datetime.now()
+    return now.strftime("%Y%m%d_%H%M%S"), now.strftime('%Y-%m-%d %H:%M:%S'), now.isoformat()
+
 
 class ExportWorker(QThread):
     """Worker thread for exporting playlists"""
@@ -351,17 +610,44 @@ class ExportWorker(QThread):
     progress = pyqtSignal(int, str)
     finished = pyqtSignal(list)
     error = pyqtSignal(str)
+    # Emitted once a cancelled run has stopped all of its fetch threads
+    cancelled = pyqtSignal()
     
     def __init__(self, export_format: ExportFormat, playlists: List[Playlist],
-                 sp: spotipy.Spotify, output_dir: str, webhook_url: str = ""):
+                 sp: 'spotipy.Spotify', output_dir: str, webhook_url: str = "",
+                 compress_json: bool = False,
+                 track_cache: Optional[Dict[Tuple[str, str], List[Track]]] = None):
         super().__init__()
         self.export_format = export_format
         self.playlists = playlists
         self.sp = sp
         self.output_dir = Path(output_dir)
+        # Filenames are joined onto the plain string rather than through Path
+        self._output_dir_str = os.fspath(self.output_dir)
         self.webhook_url = webhook_url
+        self.compress_json = compress_json
+        # Owned by the window, so tracks fetched by one export are reused by
+        # the next as long as the playlist snapshot has not changed
+        self.track_cache = {} if track_cache is None else track_cache
+        # Artist and album names repeat across a library; each parsed response
+        # carries its own copy, so equal strings are collapsed to one object
+        self._str_pool: Dict[str, str] = {}
+        self._page_executor: Optional[ThreadPoolExecutor] = None
         self._is_cancelled = False
         self.exported_files = []
+        # The format is fixed for the whole run, so resolve the exporter once
+        self._exporter = {
+            ExportFormat.DISCORD: self.export_to_discord,
+            ExportFormat.CSV: self.export_to_csv,
+            ExportFormat.JSON: self.export_to_json,
+            ExportFormat.TXT: self.export_to_txt,
+            ExportFormat.MARKDOWN: self.export_to_markdown
+        }[export_format]
+        # Only Discord exports talk to the webhook; see _discord_session()
+        self._session: Optional['requests.Session'] = None
+        self._next_post = 0.0
+        # File stems handed out in this run, see _build_filename()
+        self._used_stems: Set[str] = set()
         
     def cancel(self):
         self._is_cancelled = True
@@ -369,37 +655,66 @@ class ExportWorker(QThread):
     def run(self):
         try:
             total = len(self.playlists)
+            last_percent = -1
             
-            for i, playlist in enumerate(self.playlists):
-                if self._is_cancelled:
-                    logger.info("Export cancelled by user")
-                    return
-                    
-                self.progress.emit(
-                    int((i / total) * 100),
-                    f"Exporting: {playlist.name}"
-                )
-                
-                tracks = self.get_playlist_tracks(playlist.id)
-                
-                if not tracks:
-                    logger.warning(f"No tracks found in playlist: {playlist.name}")
-                    continue
+            # Every file written by this run shares one set of timestamps
+            self._ts_compact, self._ts_human, self._ts_iso = _now_stamps()
+            self._used_stems.clear()
+            
+            # Track fetching is network bound, so upcoming playlists are
+            # fetched concurrently while the exports below are written in order.
+            # Page requests from every playlist share one pool, which caps the
+            # number of requests in flight against the Spotify API.
+            with ThreadPoolExecutor(max_workers=Constants.PAGE_FETCH_WORKERS) as self._page_executor, \
+                    ThreadPoolExecutor(max_workers=Constants.PLAYLIST_FETCH_WORKERS) as executor:
+                remaining = iter(self.playlists)
+                pending = deque()
+                for playlist in remaining:
+                    pending.append((playlist, executor.submit(self.load_tracks, playlist)))
+                    if len(pending) == Constants.PLAYLIST_LOOKAHEAD:
+                        break
                 
-                if self.export_format == ExportFormat.DISCORD:
-                    self.export_to_discord(playlist, tracks)
-                elif self.export_format == ExportFormat.CSV:
-                    filepath = self.export_to_csv(playlist, tracks)
-                    self.exported_files.append(filepath)
-                elif self.export_format == ExportFormat.JSON:
-                    filepath = self.export_to_json(playlist, tracks)
-                    self.exported_files.append(filepath)
-                elif self.export_format == ExportFormat.TXT:
-                    filepath = self.export_to_txt(playlist, tracks)
-                    self.exported_files.append(filepath)
-                elif self.export_format == ExportFormat.MARKDOWN:
-                    filepath = self.export_to_markdown(playlist, tracks)
-                    self.exported_files.append(filepath)
+                try:
+                    for i in range(total):
+                        if self._is_cancelled:
+                            break
+                        
+                        playlist, future = pending.popleft()
+                        upcoming = next(remaining, None)
+                        if upcoming is not None:
+                            pending.append((upcoming, executor.submit(self.load_tracks, upcoming)))
+                            
+                        # Only cross the thread boundary when the bar would actually move
+                        percent = i * 100 // total
+                        if percent != last_percent:
+                            self.progress.emit(percent, f"Exporting: {playlist.name}")
+                            last_percent = percent
+                        
+                        tracks = future.result()
+                        
+                        if not tracks:
+                            logger.warning("No tracks found in playlist: %s", playlist.name)
+                            continue
+                        
+                        # Discord exports don't produce a file
+                        filepath = self._exporter(playlist, tracks)
+                        if filepath:
+                            self.exported_files.append(filepath)
+                except BaseException:
+                    # Stop the fetches already running, so leaving the pools
+                    # doesn't wait for playlists that will never be written
+                    self._is_cancelled = True
+                    raise
+                finally:
+                    for _, pending_future in pending:
+                        pending_future.cancel()
+            
+            # Leaving the pools above waits for in-flight fetches, so nothing
+            # touches the shared track cache once this is reported
+            if self._is_cancelled:
+                logger.info("Export cancelled by user")
+                self.cancelled.emit()
+                return
                     
             self.progress.emit(100, "Export completed")
             self.finished.emit(self.exported_files)
@@ -407,109 +722,201 @@ class ExportWorker(QThread):
         except Exception as e:
             logger.exception("Export error")
             self.error.emit(str(e))
+        finally:
+            if self._session is not None:
+                self._session.close()
+    
+    def load_tracks(self, playlist: Playlist) -> List[Track]:
+        """Return a playlist's tracks from the cache, fetching them on a miss"""
+        # Without a snapshot there is no way to tell a stale entry apart
+        if not playlist.snapshot_id:
+            return self.get_playlist_tracks(playlist.id)
+            
+        cache_key = (playlist.id, playlist.snapshot_id)
+        tracks = self.track_cache.get(cache_key)
+        if tracks is None:
+            return self.get_playlist_tracks(playlist.id, cache_key=cache_key)
+        
+        # The listing can be older than the playlist (it is cached on disk and
+        # the window may stay open), so confirm the snapshot before reusing
+        try:
+            snapshot_id = self._page_executor.submit(
+                self.sp.playlist, playlist.id, fields='snapshot_id'
+            ).result().get('snapshot_id')
+        except Exception as e:
+            logger.warning("Failed to check snapshot of playlist %s: %s", playlist.name, e)
+            return self.get_playlist_tracks(playlist.id)
+            
+        if snapshot_id != playlist.snapshot_id:
+            logger.debug("Playlist changed since it was listed: %s", playlist.name)
+            if not snapshot_id:
+                return self.get_playlist_tracks(playlist.id)
+            cache_key = (playlist.id, snapshot_id)
+            tracks = self.track_cache.get(cache_key)
+            if tracks is None:
+                return self.get_playlist_tracks(playlist.id, cache_key=cache_key)
+        
+        logger.debug("Using cached tracks for playlist: %s", playlist.name)
+        return tracks
     
-    def get_playlist_tracks(self, playlist_id: str) -> List[Track]:
+    def get_playlist_tracks(self, playlist_id: str,
+                            cache_key: Optional[Tuple[str, str]] = None) -> List[Track]:
         """Get all tracks from a playlist with robust error handling"""
-        tracks = []
         skipped_count = 0
         
         try:
-            results = self.sp.playlist_tracks(playlist_id)
+            pages = self.fetch_track_pages(playlist_id)
         except Exception as e:
-            logger.error(f"Failed to fetch playlist tracks: {e}")
-            return tracks
+            logger.error("Failed to fetch playlist tracks: %s", e)
+            return []
         
-        while results:
+        # Every page is already in memory, so size the list once and trim
+        # the slots left empty by skipped tracks at the end
+        tracks: List[Optional[Track]] = [None] * sum(len(results['items']) for results in pages)
+        count = 0
+        
+        for results in pages:
             for item in results['items']:
                 if self._is_cancelled:
+                    del tracks[count:]
                     return tracks
                     
                 track = item.get('track')
-                if not track:
+                if not isinstance(track, dict):
                     skipped_count += 1
                     continue
                 
+                # Missing or null fields fall back to defaults up front, so
+                # the common path never raises
                 try:
-                    track_name = track.get('name', 'Unknown Track')
-                    
-                    artists = track.get('artists', [])
-                    if artists:
-                        artist_names = ', '.join([artist.get('name', 'Unknown Artist') for artist in artists])
-                    else:
-                        artist_names = 'Unknown Artist'
+                    track_name = track.get('name') or _UNKNOWN_TRACK
                     
-                    album = track.get('album', {})
-                    album_name = album.get('name', 'Unknown Album') if album else 'Unknown Album'
+                    artists = track.get('artists')
+                    artist_names = self._pooled(', '.join(
+                        artist.get('name') or _UNKNOWN_ARTIST for artist in artists if artist
+                    ) or _UNKNOWN_ARTIST) if artists else _UNKNOWN_ARTIST
+                    album_name = self._pooled((track.get('album') or {}).get('name') or _UNKNOWN_ALBUM)
                     
-                    duration_ms = track.get('duration_ms', 0)
+                    duration_ms = track.get('duration_ms') or 0
                     
-                    external_urls = track.get('external_urls', {})
-                    if external_urls and 'spotify' in external_urls:
-                        track_url = external_urls['spotify']
-                    else:
-                        track_id = track.get('id', '')
+                    track_url = (track.get('external_urls') or {}).get('spotify')
+                    if not track_url:
+                        track_id = track.get('id')
                         if track_id:
-                            track_url = f"https://open.spotify.com/track/{track_id}"
+                            track_url = f"{_SPOTIFY_URL}/track/{track_id}"
                         else:
-                            track_url = "https://open.spotify.com"
-                            logger.debug(f"No Spotify URL found for track: {track_name}")
-                    
-                    tracks.append(Track(
-                        name=track_name,
-                        artist=artist_names,
-                        album=album_name,
-                        duration_ms=duration_ms,
-                        url=track_url
-                    ))
-                    
-                except KeyError as e:
+                            track_url = _SPOTIFY_URL
+                            logger.debug("No Spotify URL found for track: %s", track_name)
+                except (AttributeError, TypeError) as e:
+                    # Malformed entries can repeat across a playlist; a
+                    # traceback per entry would dominate the loop
                     skipped_count += 1
-                    logger.debug(f"Missing key {e} for track, skipping")
+                    logger.debug("Malformed track %s, skipping: %s", track.get('id'), e)
                     continue
-                except Exception as e:
-                    skipped_count += 1
-                    logger.debug(f"Failed to process track: {e}")
-                    continue
-                    
-            if results['next']:
-                try:
-                    results = self.sp.next(results)
-                except Exception as e:
-                    logger.error(f"Failed to get next page of tracks: {e}")
-                    break
-            else:
-                break
+                
+                # Positional construction skips NamedTuple keyword parsing
+                tracks[count] = Track(track_name, artist_names, album_name, duration_ms, track_url)
+                count += 1
+        
+        del tracks[count:]
         
         if skipped_count > 0:
-            logger.info(f"Skipped {skipped_count} tracks due to missing data")
-            
+            logger.info("Skipped %s tracks due to missing data", skipped_count)
+        
+        # Only a complete fetch is cached; a page that failed would otherwise
+        # stay missing from every later export of this snapshot
+        if cache_key is not None and not self._is_cancelled and \
+                count + skipped_count >= pages[0].get('total', 0):
+            self.track_cache[cache_key] = tracks
+                
         return tracks
     
-    def sanitize_filename(self, filename: str) -> str:
+    def _pooled(self, value: str) -> str:
+        return self._str_pool.setdefault(value, value)
+    
+    def fetch_track_pages(self, playlist_id: str) -> List[Dict[str, Any]]:
+        """Fetch every page of a playlist, requesting pages after the first in parallel"""
+        # Every request goes through the page pool, first pages included, so
+        # no more than PAGE_FETCH_WORKERS are in flight however many playlists
+        # are being fetched
+        first_page = self._page_executor.submit(
+            self.sp.playlist_items,
+            playlist_id,
+            limit=Constants.TRACK_PAGE_SIZE,
+            fields=Constants.TRACK_FIELDS,
+            additional_types=('track',)
+        ).result()
+        pages = [first_page]
+        
+        offsets = range(Constants.TRACK_PAGE_SIZE, first_page.get('total', 0), Constants.TRACK_PAGE_SIZE)
+        if not offsets:
+            return pages
+        
+        # Futures are kept in offset order so tracks keep the playlist order
+        futures = [
+            self._page_executor.submit(
+                self.sp.playlist_items,
+                playlist_id,
+                limit=Constants.TRACK_PAGE_SIZE,
+                fields=Constants.TRACK_FIELDS,
+                offset=offset,
+                additional_types=('track',)
+            )
+            for offset in offsets
+        ]
+        
+        for offset, future in zip(offsets, futures):
+            if self._is_cancelled:
+                for pending in futures:
+                    pending.cancel()
+                break
+                
+            try:
+                pages.append(future.result())
+            except Exception as e:
+                # Keep the pages fetched so far, as a broken 'next' chain did
+                logger.error("Failed to get tracks at offset %s: %s", offset, e)
+                for pending in futures:
+                    pending.cancel()
+                break
+            
+        return pages
+    
+    @staticmethod
+    @lru_cache(maxsize=256)
+    def sanitize_filename(filename: str) -> str:
         """Sanitize filename for safe file creation"""
-        # regex inv char
-        filename = re.sub(r'[<>:"/\\|?*]', '', filename)
-        filename = re.sub(r'[\x00-\x1f\x7f-\x9f]', '', filename)
-        filename = filename.strip('. ')
+        filename = filename.translate(_FILENAME_DELETE_TABLE).strip('. ')
         return filename[:200] if filename else "playlist"
     
+    def _build_filename(self, playlist: Playlist, ext: str) -> str:
+        """Return the output path for a playlist export with the given extension"""
+        # sanitize_filename is memoized and the timestamp is fixed per run
+        stem = base = f"{self.sanitize_filename(playlist.name)}_{self._ts_compact}"
+        # Playlist names need not be unique, and every file of a run shares
+        # the timestamp, so a repeated name gets a numeric suffix instead of
+        # overwriting the earlier file. Names differing only in case are
+        # compared folded, since they collide on Windows and macOS
+        suffix = 2
+        while stem.casefold() in self._used_stems:
+            stem = f"{base}_{suffix}"
+            suffix += 1
+        self._used_stems.add(stem.casefold())
+        return os.path.join(self._output_dir_str, f"{stem}.{ext}")
+    
     def export_to_csv(self, playlist: Playlist, tracks: List[Track]) -> str:
-        timestamp = datetime.now().strftime("%Y%m%d_%H%M%S")
-        safe_name = self.sanitize_filename(playlist.name)
-        filename = self.output_dir / f"{safe_name}_{timestamp}.csv"
-        
-        with open(filename, 'w', newline='', encoding='utf-8-sig') as csvfile:
-            writer = csv.DictWriter(csvfile, fieldfields=['name', 'artist', 'album', 'duration_ms', 'url'])
-            writer.writeheader()
-            writer.writerows([track.to_dict() for track in tracks])
+        filename = self._build_filename(playlist, 'csv')
+        
+        with open(filename, 'w', newline='', encoding='utf-8-sig', buffering=Constants.WRITE_BUFFER_SIZE) as csvfile:
+            writer = csv.writer(csvfile)
+            writer.writerow(Track._fields)
+            writer.writerows(tracks)
             
-        logger.info(f"Exported {len(tracks)} tracks to CSV: {filename}")
-        return str(filename)
+        logger.info("Exported %s tracks to CSV: %s", len(tracks), filename)
+        return filename
     
     def export_to_json(self, playlist: Playlist, tracks: List[Track]) -> str:
-        timestamp = datetime.now().strftime("%Y%m%d_%H%M%S")
-        safe_name = self.sanitize_filename(playlist.name)
-        filename = self.output_dir / f"{safe_name}_{timestamp}.json"
+        filename = self._build_filename(playlist, 'json')
         
         data = {
             'playlist': {
@@ -518,276 +925,244 @@ class ExportWorker(QThread):
                 'description': playlist.description,
                 'track_count': len(tracks)
             },
-            'tracks': [track.to_dict() for track in tracks],
-            'exported_at': datetime.now().isoformat()
+            'tracks': tracks,
+            'exported_at': self._ts_iso
         }
         
-        with open(filename, 'w', encoding='utf-8') as jsonfile:
-            json.dump(data, jsonfile, indent=2, ensure_ascii=False)
+        if orjson is not None:
+            # Tracks are converted one at a time by the encoder instead of
+            # materialising a second list holding a dict per track
+            payload = orjson.dumps(data, default=_json_default, option=orjson.OPT_INDENT_2)
+        else:
+            # The stdlib encoder would write the Track tuples as arrays
+            data['tracks'] = [track.to_dict() for track in tracks]
+            payload = json.dumps(data, indent=2, ensure_ascii=False).encode('utf-8')
+        if self.compress_json:
+            # Level 1 already shrinks the repetitive JSON several times over
+            filename += '.gz'
+            with gzip.open(filename, 'wb', compresslevel=1) as jsonfile:
+                jsonfile.write(payload)
+        else:
+            with open(filename, 'wb') as jsonfile:
+                jsonfile.write(payload)
             
-        logger.info(f"Exported {len(tracks)} tracks to JSON: {filename}")
-        return str(filename)
+        logger.info("Exported %s tracks to JSON: %s", len(tracks), filename)
+        return filename
     
     def export_to_txt(self, playlist: Playlist, tracks: List[Track]) -> str:
-        timestamp = datetime.now().strftime("%Y%m%d_%H%M%S")
-        safe_name = self.sanitize_filename(playlist.name)
-        filename = self.output_dir / f"{safe_name}_{timestamp}.txt"
-        
-        with open(filename, 'w', encoding='utf-8') as txtfile:
-            txtfile.write(f"Playlist: {playlist.name}\n")
-            txtfile.write(f"Owner: {playlist.owner}\n")
-            txtfile.write(f"Tracks: {len(tracks)}\n")
-            txtfile.write(f"Exported: {datetime.now().strftime('%Y-%m-%d %H:%M:%S')}\n")
-            txtfile.write("=" * 80 + "\n\n")
-            
-            for i, track in enumerate(tracks, 1):
-                txtfile.write(f"{i}. {track.name}\n")
-                txtfile.write(f"   Artist: {track.artist}\n")
-                txtfile.write(f"   Album: {track.album}\n")
-                txtfile.write(f"   URL: {track.url}\n\n")
+        filename = self._build_filename(playlist, 'txt')
+        
+        parts = [
+            f"Playlist: {playlist.name}\n",
+            f"Owner: {playlist.owner}\n",
+            f"Tracks: {len(tracks)}\n",
+            f"Exported: {self._ts_human}\n",
+            _TXT_RULE
+        ]
+        
+        parts.extend([
+            f"{i}. {track.name}\n"
+            f"   Artist: {track.artist}\n"
+            f"   Album: {track.album}\n"
+            f"   URL: {track.url}\n\n"
+            for i, track in enumerate(tracks, 1)
+        ])
+        
+        # Build the whole file in memory and hand it to the encoder once
+        with open(filename, 'w', encoding='utf-8', buffering=Constants.WRITE_BUFFER_SIZE) as txtfile:
+            txtfile.write(''.join(parts))
                 
-        logger.info(f"Exported {len(tracks)} tracks to TXT: {filename}")
-        return str(filename)
+        logger.info("Exported %s tracks to TXT: %s", len(tracks), filename)
+        return filename
     
     def export_to_markdown(self, playlist: Playlist, tracks: List[Track]) -> str:
-        timestamp = datetime.now().strftime("%Y%m%d_%H%M%S")
-        safe_name = self.sanitize_filename(playlist.name)
-        filename = self.output_dir / f"{safe_name}_{timestamp}.md"
-        
-        with open(filename, 'w', encoding='utf-8') as mdfile:
-            mdfile.write(f"# {playlist.name}\n\n")
-            mdfile.write(f"**Owner:** {playlist.owner}  \n")
-            mdfile.write(f"**Tracks:** {len(tracks)}  \n")
-            mdfile.write(f"**Exported:** {datetime.now().strftime('%Y-%m-%d %H:%M:%S')}  \n\n")
-            
-            if playlist.description:
-                mdfile.write(f"*{playlist.description}*\n\n")
-            
-            mdfile.write("---\n\n")
-            mdfile.write("## Tracks\n\n")
-            
-            for i, track in enumerate(tracks, 1):
-                mdfile.write(f"{i}. **{track.name}** - {track.artist}  \n")
-                mdfile.write(f"   *{track.album}*  \n")
-                mdfile.write(f"   [Listen on Spotify]({track.url})\n\n")
+        filename = self._build_filename(playlist, 'md')
+        
+        parts = [
+            f"# {playlist.name}\n\n",
+            f"**Owner:** {playlist.owner}  \n",
+            f"**Tracks:** {len(tracks)}  \n",
+            f"**Exported:** {self._ts_human}  \n\n"
+        ]
+        
+        if playlist.description:
+            parts.append(f"*{playlist.description}*\n\n")
+        
+        parts.append(_MD_TRACKS_HEADING)
+        
+        parts.extend([
+            f"{i}. **{track.name}** - {track.artist}  \n"
+            f"   *{track.album}*  \n"
+            f"   [Listen on Spotify]({track.url})\n\n"
+            for i, track in enumerate(tracks, 1)
+        ])
+        
+        with open(filename, 'w', encoding='utf-8', buffering=Constants.WRITE_BUFFER_SIZE) as mdfile:
+            mdfile.write(''.join(parts))
                 
-        logger.info(f"Exported {len(tracks)} tracks to Markdown: {filename}")
-        return str(filename)
+        logger.info("Exported %s tracks to Markdown: %s", len(tracks), filename)
+        return filename
     
     def export_to_discord(self, playlist: Playlist, tracks: List[Track]):
         if not self.webhook_url:
             raise ValueError("Discord webhook URL is required")
-            
-        header = f"**{playlist.name}**\n"
-        header += f"*By {playlist.owner} • {len(tracks)} tracks*\n"
-        header += "─" * 40 + "\n\n"
+        
+        header = (
+            f"{_DISCORD_SEP}"
+            f"## {playlist.name}\n"
+            f"*By {playlist.owner} • {len(tracks)} tracks*\n"
+            f"{_DISCORD_SEP}"
+        )
         
         messages = [header]
-        current_message = ""
+        # Collect lines and join once per message; += on a growing str
+        # copies the whole message again for every track
+        buffer = []
+        buffer_len = 0
         
         for i, track in enumerate(tracks, 1):
             track_line = f"{i}. **{track.name}** - {track.artist}\n"
             
-            if len(current_message) + len(track_line) > 1800:
-                messages.append(current_message)
-                current_message = track_line
-            else:
-                current_message += track_line
+            if buffer and buffer_len + len(track_line) > Constants.DISCORD_MESSAGE_LIMIT:
+                messages.append(''.join(buffer))
+                buffer = []
+                buffer_len = 0
+            buffer.append(track_line)
+            buffer_len += len(track_line)
         
-        if current_message:
-            messages.append(current_message)
+        if buffer:
+            messages.append(''.join(buffer))
         
         for msg in messages:
             if self._is_cancelled:
                 return
-            response = requests.post(self.webhook_url, json={'content': msg})
+            response = self._post_to_discord(msg)
             if response.status_code not in (200, 204):
                 raise Exception(f"Failed to send to Discord: {response.status_code}")
                 
-        logger.info(f"Exported {len(tracks)} tracks to Discord: {playlist.name}")
-    
-    def get_playlist_tracks(self, playlist_id: str) -> List[Track]:
-        """Get all tracks from a playlist with robust error handling"""
-        tracks = []
-        results = self.sp.playlist_tracks(playlist_id)
-        
-        while results:
-            for item in results['items']:
-                if self._is_cancelled:
-                    return tracks
-                    
-                track = item.get('track')
-                if not track:
-                    logger.warning("Skipping item with no track data")
-                    continue
-                
-                try:
-                    track_name = track.get('name', 'Unknown Track')
-                    
-                    artists = track.get('artists', [])
-                    if artists:
-                        artist_names = ', '.join([artist.get('name', 'Unknown Artist') for artist in artists])
-                    else:
-                        artist_names = 'Unknown Artist'
-                    
-                    album = track.get('album', {})
-                    album_name = album.get('name', 'Unknown Album') if album else 'Unknown Album'
-                    
-                    duration_ms = track.get('duration_ms', 0)
-                    
-                    external_urls = track.get('external_urls', {})
-                    if external_urls and 'spotify' in external_urls:
-                        track_url = external_urls['spotify']
-                    else:
-                        track_id = track.get('id', '')
-                        if track_id:
-                            track_url = f"https://open.spotify.com/track/{track_id}"
-                        else:
-                            track_url = "https://open.spotify.com"
-                            logger.warning(f"No Spotify URL found for track: {track_name}")
-                    
-                    tracks.append(Track(
-                        name=track_name,
-                        artist=artist_names,
-                        album=album_name,
-                        duration_ms=duration_ms,
-                        url=track_url
-                    ))
-                    
-                except KeyError as e:
-                    logger.warning(f"Missing key {e} for track, skipping")
-                    continue
-                except Exception as e:
-                    logger.warning(f"Failed to process track: {e}", exc_info=True)
-                    continue
-                    
-            if results['next']:
-                results = self.sp.next(results)
-            else:
-                break
-                
-        return tracks
-    
-    def sanitize_filename(self, filename: str) -> str:
-        """Regex filename for safe file creation"""
-        filename = re.sub(r'[<>:"/\\|?*]', '', filename)
-        filename = re.sub(r'[\x00-\x1f\x7f-\x9f]', '', filename)
-        filename = filename.strip('. ')
-        return filename[:200] if filename else "playlist"
-    
-    def export_to_csv(self, playlist: Playlist, tracks: List[Track]) -> str:
-        timestamp = datetime.now().strftime("%Y%m%d_%H%M%S")
-        safe_name = self.sanitize_filename(playlist.name)
-        filename = self.output_dir / f"{safe_name}_{timestamp}.csv"
-        
-        with open(filename, 'w', newline='', encoding='utf-8-sig') as csvfile:
-            writer = csv.DictWriter(csvfile, fieldnames=['name', 'artist', 'album', 'duration_ms', 'url'])
-            writer.writeheader()
-            writer.writerows([track.to_dict() for track in tracks])
+        logger.info("Exported %s tracks to Discord: %s", len(tracks), playlist.name)
+    
+    def _discord_session(self) -> 'requests.Session':
+        """Return the webhook session, importing requests on first use"""
+        if self._session is None:
+            import requests
+            from requests.adapters import HTTPAdapter
+            from urllib3.util.retry import Retry
             
-        logger.info(f"Exported to CSV: {filename}")
-        return str(filename)
-    
-    def export_to_json(self, playlist: Playlist, tracks: List[Track]) -> str:
-        timestamp = datetime.now().strftime("%Y%m%d_%H%M%S")
-        safe_name = self.sanitize_filename(playlist.name)
-        filename = self.output_dir / f"{safe_name}_{timestamp}.json"
-        
-        data = {
-            'playlist': {
-                'name': playlist.name,
-                'owner': playlist.owner,
-                'description': playlist.description,
-                'track_count': len(tracks)
-            },
-            'tracks': [track.to_dict() for track in tracks],
-            'exported_at': datetime.now().isoformat()
-        }
+            self._session = requests.Session()
+            # Posts are sequential, so one kept-alive connection is enough. Only
+            # connection failures are retried: the POST has not been sent then,
+            # which covers a keep-alive connection the server already closed.
+            self._session.mount('https://', HTTPAdapter(
+                pool_connections=1,
+                pool_maxsize=1,
+                max_retries=Retry(total=3, connect=3, read=0, status=0, other=0, backoff_factor=0.5)
+            ))
+        return self._session
+    
+    def _post_to_discord(self, content: str) -> 'requests.Response':
+        """Post one message to the webhook, following Discord's rate limit headers"""
+        # Encoded once, so a rate-limited retry resends the same bytes
+        if orjson is not None:
+            body = orjson.dumps({'content': content})
+        else:
+            body = json.dumps({'content': content}, ensure_ascii=False).encode('utf-8')
         
-        with open(filename, 'w', encoding='utf-8') as jsonfile:
-            json.dump(data, jsonfile, indent=2, ensure_ascii=False)
-            
-        logger.info(f"Exported to JSON: {filename}")
-        return str(filename)
-    
-    def export_to_txt(self, playlist: Playlist, tracks: List[Track]) -> str:
-        timestamp = datetime.now().strftime("%Y%m%d_%H%M%S")
-        safe_name = self.sanitize_filename(playlist.name)
-        filename = self.output_dir / f"{safe_name}_{timestamp}.txt"
-        
-        with open(filename, 'w', encoding='utf-8') as txtfile:
-            txtfile.write(f"Playlist: {playlist.name}\n")
-            txtfile.write(f"Owner: {playlist.owner}\n")
-            txtfile.write(f"Tracks: {len(tracks)}\n")
-            txtfile.write(f"Exported: {datetime.now().strftime('%Y-%m-%d %H:%M:%S')}\n")
-            txtfile.write("=" * 80 + "\n\n")
-            
-            for i, track in enumerate(tracks, 1):
-                txtfile.write(f"{i}. {track.name}\n")
-                txtfile.write(f"   Artist: {track.artist}\n")
-                txtfile.write(f"   Album: {track.album}\n")
-                txtfile.write(f"   URL: {track.url}\n\n")
+        for _ in range(Constants.DISCORD_MAX_RETRIES):
+            wait = self._next_post - time.monotonic()
+            if wait > 0:
+                time.sleep(wait)
                 
-        logger.info(f"Exported to TXT: {filename}")
-        return str(filename)
-    
-    def export_to_markdown(self, playlist: Playlist, tracks: List[Track]) -> str:
-        timestamp = datetime.now().strftime("%Y%m%d_%H%M%S")
-        safe_name = self.sanitize_filename(playlist.name)
-        filename = self.output_dir / f"{safe_name}_{timestamp}.md"
-        
-        with open(filename, 'w', encoding='utf-8') as mdfile:
-            mdfile.write(f"# {playlist.name}\n\n")
-            mdfile.write(f"**Owner:** {playlist.owner}  \n")
-            mdfile.write(f"**Tracks:** {len(tracks)}  \n")
-            mdfile.write(f"**Exported:** {datetime.now().strftime('%Y-%m-%d %H:%M:%S')}  \n\n")
-            
-            if playlist.description:
-                mdfile.write(f"*{playlist.description}*\n\n")
+            response = self._discord_session().post(
+                self.webhook_url,
+                data=body,
+                headers=_JSON_HEADERS,
+                timeout=Constants.DISCORD_TIMEOUT
+            )
+            now = time.monotonic()
+            headers = response.headers
             
-            mdfile.write("---\n\n")
-            mdfile.write("## Tracks\n\n")
+            # Post back to back while the bucket has room and only wait for
+            # the reset once it is empty
+            if 'X-RateLimit-Remaining' in headers:
+                if headers['X-RateLimit-Remaining'] == '0':
+                    self._next_post = now + _header_seconds(headers.get('X-RateLimit-Reset-After'))
+                else:
+                    self._next_post = now
+            else:
+                self._next_post = now + Constants.DISCORD_POST_INTERVAL
             
-            for i, track in enumerate(tracks, 1):
-                mdfile.write(f"{i}. **{track.name}** - {track.artist}  \n")
-                mdfile.write(f"   *{track.album}*  \n")
-                mdfile.write(f"   [Listen on Spotify]({track.url})\n\n")
+            if response.status_code != 429 or self._is_cancelled:
+                return response
                 
-        logger.info(f"Exported to Markdown: {filename}")
-        return str(filename)
+            retry_after = _header_seconds(headers.get('Retry-After'), default=1.0)
+            self._next_post = max(self._next_post, now + retry_after)
+            logger.warning("Discord rate limited the webhook, retrying in %.1fs", retry_after)
+            
+        return response
+
+
+# ==================== Playlist Loader ====================
+class PlaylistLoader(QThread):
+    """Worker thread that fetches the user's playlist library"""
+    loaded = pyqtSignal(list)
+    error = pyqtSignal(str)
     
-    def export_to_discord(self, playlist: Playlist, tracks: List[Track]):
-        if not self.webhook_url:
-            raise ValueError("Discord webhook URL is required")
-        
-        header = "─" * 40 + "\n\n"
-        header += f"##{playlist.name}\n"
-        header += f"*By {playlist.owner} • {len(tracks)} tracks*\n"
-        header += "─" * 40 + "\n\n"
-        
-        messages = [header]
-        current_message = ""
+    def __init__(self, sp: 'spotipy.Spotify', cache: PlaylistCache, refresh: bool = False):
+        super().__init__()
+        self.sp = sp
+        self.cache = cache
+        self.refresh = refresh
         
-        for i, track in enumerate(tracks, 1):
-            track_line = f"{i}. **{track.name}** - {track.artist}\n"
+    def run(self):
+        try:
+            user_id = self.sp.current_user()['id']
             
-            if len(current_message) + len(track_line) > 1800:
-                messages.append(current_message)
-                current_message = track_line
+            playlists = None if self.refresh else self.cache.get(user_id)
+            if playlists is None:
+                playlists = [
+                    self.parse_playlist(item)
+                    for page in self.fetch_playlist_pages()
+                    for item in page['items']
+                    if item
+                ]
+                self.cache.set(user_id, playlists)
             else:
-                current_message += track_line
-        
-        if current_message:
-            messages.append(current_message)
-        
-        for msg in messages:
-            if self._is_cancelled:
-                return
-            response = requests.post(self.webhook_url, json={'content': msg})
-            if response.status_code not in (200, 204):
-                raise Exception(f"Failed to send to Discord: {response.status_code}")
+                logger.info("Using cached playlist library")
                 
-        logger.info(f"Exported to Discord: {playlist.name}")
+            self.loaded.emit(playlists)
+        except Exception as e:
+            logger.exception("Failed to load playlists")
+            self.error.emit(str(e))
+    
+    def fetch_playlist_pages(self) -> List[Dict[str, Any]]:
+        """Fetch every playlist page, requesting pages after the first in parallel"""
+        limit = Constants.PLAYLIST_PAGE_SIZE
+        first_page = self.sp.current_user_playlists(limit=limit)
+        
+        # The first page reports the library size, so the remaining offsets
+        # are known up front instead of following the 'next' links one by one
+        offsets = range(limit, first_page['total'], limit)
+        if not offsets:
+            return [first_page]
+        
+        with ThreadPoolExecutor(max_workers=Constants.PLAYLIST_PAGE_WORKERS) as executor:
+            pages = executor.map(
+                lambda offset: self.sp.current_user_playlists(limit=limit, offset=offset),
+                offsets
+            )
+            return [first_page, *pages]
+    
+    @staticmethod
+    def parse_playlist(item: Dict[str, Any]) -> Playlist:
+        return Playlist(
+            id=item['id'],
+            name=item['name'],
+            track_count=item['tracks']['total'],
+            owner=item['owner']['display_name'] or '',
+            description=item.get('description') or '',
+            snapshot_id=item.get('snapshot_id') or ''
+        )
 
 
 # ==================== Login Window ====================
@@ -823,36 +1198,22 @@ class LoginWindow(QDialog):
         title_layout.setSpacing(0)
         
         dialog_title = QLabel("Connect to Spotify")
-        dialog_title.setFont(QFont('Segoe UI', 22, QFont.Weight.Bold))
-        dialog_title.setStyleSheet(f"color: {Constants.TEXT_PRIMARY};")
+        dialog_title.setFont(ui_font(22, bold=True))
         
         close_btn = QPushButton("×")
+        close_btn.setObjectName("DialogCloseButton")
         close_btn.setFixedSize(36, 36)
         close_btn.setCursor(QCursor(Qt.CursorShape.PointingHandCursor))
         close_btn.clicked.connect(self.reject)
-        close_btn.setStyleSheet(f"""
-            QPushButton {{
-                background-color: transparent;
-                color: {Constants.TEXT_SECONDARY};
-                border: none;
-                font-size: 28px;
-                font-weight: bold;
-                border-radius: 6px;
-            }}
-            QPushButton:hover {{
-                background-color: {Constants.ERROR};
-                color: white;
-            }}
-        """)
         
         title_layout.addWidget(dialog_title)
         title_layout.addStretch()
         title_layout.addWidget(close_btn)
         
         subtitle = QLabel('Enter your Spotify Developer credentials to continue')
-        subtitle.setFont(QFont('Segoe UI', 11))
+        subtitle.setFont(ui_font(11))
         subtitle.setWordWrap(True)
-        subtitle.setStyleSheet(f"color: {Constants.TEXT_SECONDARY};")
+        subtitle.setObjectName("SecondaryLabel")
         
         id_section = QWidget()
         id_layout = QVBoxLayout(id_section)
@@ -860,13 +1221,12 @@ class LoginWindow(QDialog):
         id_layout.setContentsMargins(0, 0, 0, 0)
         
         id_label = QLabel('Client ID')
-        id_label.setFont(QFont('Segoe UI', 11, QFont.Weight.Bold))
-        id_label.setStyleSheet(f"color: {Constants.TEXT_PRIMARY};")
+        id_label.setFont(ui_font(11, bold=True))
         
         self.id_input = LineEdit()
         self.id_input.setPlaceholderText('Enter your Spotify Client ID')
         self.id_input.setMinimumHeight(45)
-        self.id_input.setFont(QFont('Segoe UI', 11))
+        self.id_input.setFont(ui_font(11))
         
         id_layout.addWidget(id_label)
         id_layout.addWidget(self.id_input)
@@ -877,8 +1237,7 @@ class LoginWindow(QDialog):
         secret_layout.setContentsMargins(0, 0, 0, 0)
         
         secret_label = QLabel('Client Secret')
-        secret_label.setFont(QFont('Segoe UI', 11, QFont.Weight.Bold))
-        secret_label.setStyleSheet(f"color: {Constants.TEXT_PRIMARY};")
+        secret_label.setFont(ui_font(11, bold=True))
         
         self.secret_input = PasswordLineEdit()
         self.secret_input.setPlaceholderText("Enter your Spotify Client Secret")
@@ -908,13 +1267,13 @@ class LoginWindow(QDialog):
         self.cancel_btn = PushButton('Cancel')
         self.cancel_btn.setMinimumHeight(48)
         self.cancel_btn.setMinimumWidth(120)
-        self.cancel_btn.setFont(QFont('Segoe UI', 12, QFont.Weight.Bold))
+        self.cancel_btn.setFont(ui_font(12, bold=True))
         self.cancel_btn.clicked.connect(self.reject)
         
         self.login_btn = PrimaryPushButton('Connect')
         self.login_btn.setMinimumHeight(48)
         self.login_btn.setMinimumWidth(120)
-        self.login_btn.setFont(QFont('Segoe UI', 12, QFont.Weight.Bold))
+        self.login_btn.setFont(ui_font(12, bold=True))
         self.login_btn.clicked.connect(self.attempt_login)
         self.login_btn.setDefault(True)
         
@@ -933,14 +1292,6 @@ class LoginWindow(QDialog):
         main_layout.addWidget(button_container)
         
         outer_layout.addWidget(container)
-        
-        self.setStyleSheet(f"""
-            QDialog {{
-                background-color: {Constants.BACKGROUND};
-                border: 1px solid {Constants.BORDER};
-                border-radius: 8px;
-            }}
-        """)
     
     def toggle_secret_visibility(self, state):
         if state == Qt.CheckState.Checked.value:
@@ -965,6 +1316,8 @@ class LoginWindow(QDialog):
             self.login_btn.setText('Connecting...')
             QApplication.processEvents()
             
+            from spotipy.oauth2 import SpotifyOAuth
+            
             auth_manager = SpotifyOAuth(
                 client_id=client_id,
                 client_secret=client_secret,
@@ -1009,7 +1362,7 @@ class SettingsDialog(QDialog):
         layout.setContentsMargins(25, 25, 25, 25)
         
         title = QLabel("Settings")
-        title.setFont(QFont('Segoe UI', 18, QFont.Weight.Bold))
+        title.setFont(ui_font(18, bold=True))
         
         export_group = Card()
         export_layout = QVBoxLayout(export_group)
@@ -1017,7 +1370,7 @@ class SettingsDialog(QDialog):
         export_layout.setSpacing(12)
         
         group_title = QLabel("Export Location")
-        group_title.setFont(QFont('Segoe UI', 12, QFont.Weight.Bold))
+        group_title.setFont(ui_font(12, bold=True))
         
         location_layout = QHBoxLayout()
         self.location_input = LineEdit()
@@ -1033,8 +1386,12 @@ class SettingsDialog(QDialog):
         location_layout.addWidget(self.location_input, stretch=1)
         location_layout.addWidget(browse_btn)
         
+        self.compress_json_cb = CheckBox('Compress JSON exports (.json.gz)')
+        self.compress_json_cb.setChecked(self.config_manager.get_bool_setting('compress_json'))
+        
         export_layout.addWidget(group_title)
         export_layout.addLayout(location_layout)
+        export_layout.addWidget(self.compress_json_cb)
         
         layout.addWidget(title)
         layout.addWidget(export_group)
@@ -1054,15 +1411,6 @@ class SettingsDialog(QDialog):
         
         layout.addLayout(button_layout)
         
-        self.setStyleSheet(f"""
-            QDialog {{
-                background-color: {Constants.BACKGROUND};
-            }}
-            QLabel {{
-                color: {Constants.TEXT_PRIMARY};
-            }}
-        """)
-        
     def browse_export_location(self):
         directory = QFileDialog.getExistingDirectory(
             self,
@@ -1074,6 +1422,7 @@ class SettingsDialog(QDialog):
     
     def save_settings(self):
         self.config_manager.set_setting('export_location', self.location_input.text())
+        self.config_manager.set_setting('compress_json', self.compress_json_cb.isChecked())
         self.accept()
 
 
@@ -1081,12 +1430,21 @@ class SettingsDialog(QDialog):
 class MainWindow(QMainWindow):
     """Modern main window with custom title bar"""
     
-    def __init__(self, sp: spotipy.Spotify):
+    def __init__(self, sp: 'spotipy.Spotify'):
         super().__init__()
         self.sp = sp
         self.config_manager = ConfigManager()
         self.playlists: List[Playlist] = []
         self.worker: Optional[ExportWorker] = None
+        self.loader: Optional[PlaylistLoader] = None
+        self.playlist_cache = PlaylistCache()
+        # Tracks keyed by (playlist id, snapshot id), shared by every export
+        self.track_cache: Dict[Tuple[str, str], List[Track]] = {}
+        # Last applied search and the rows it left visible
+        self._filter_text = ''
+        self._filter_matches: Sequence[int] = range(0)
+        self._selected_count = 0
+        self._export_active = False
         
         self.setWindowFlag(Qt.WindowType.FramelessWindowHint)
         
@@ -1129,26 +1487,9 @@ class MainWindow(QMainWindow):
         main_layout.addWidget(content, stretch=1)
         
         self.status_bar = QStatusBar()
-        self.status_bar.setStyleSheet(f"""
-            QStatusBar {{
-                background-color: {Constants.SURFACE};
-                color: {Constants.TEXT_SECONDARY};
-                border-top: 1px solid {Constants.BORDER};
-                padding: 8px 30px;
-            }}
-        """)
         self.setStatusBar(self.status_bar)
         self.status_bar.showMessage('Ready')
         
-        self.setStyleSheet(f"""
-            QMainWindow {{
-                background-color: {Constants.BACKGROUND};
-            }}
-            QLabel {{
-                color: {Constants.TEXT_PRIMARY};
-            }}
-        """)
-        
     def create_header(self) -> QWidget:
         container = QWidget()
         layout = QHBoxLayout(container)
@@ -1160,11 +1501,11 @@ class MainWindow(QMainWindow):
         title_layout.setContentsMargins(0, 0, 0, 0)
         
         title = QLabel('Playlist Library')
-        title.setFont(QFont('Segoe UI', 24, QFont.Weight.Bold))
+        title.setFont(ui_font(24, bold=True))
         
         subtitle = QLabel('Manage and export your Spotify playlists')
-        subtitle.setFont(QFont('Segoe UI', 12))
-        subtitle.setStyleSheet(f"color: {Constants.TEXT_SECONDARY};")
+        subtitle.setFont(ui_font(12))
+        subtitle.setObjectName("SecondaryLabel")
         
         title_layout.addWidget(title)
         title_layout.addWidget(subtitle)
@@ -1175,11 +1516,12 @@ class MainWindow(QMainWindow):
         settings_btn = PushButton('Settings')
         settings_btn.clicked.connect(self.show_settings)
         
-        refresh_btn = PushButton('Refresh')
-        refresh_btn.clicked.connect(self.load_playlists)
+        self.refresh_btn = PushButton('Refresh')
+        # Refresh always goes to Spotify instead of the on-disk cache
+        self.refresh_btn.clicked.connect(lambda: self.load_playlists(refresh=True))
         
         action_layout.addWidget(settings_btn)
-        action_layout.addWidget(refresh_btn)
+        action_layout.addWidget(self.refresh_btn)
         
         layout.addWidget(title_section)
         layout.addStretch()
@@ -1201,11 +1543,17 @@ class MainWindow(QMainWindow):
         search_layout.setContentsMargins(0, 0, 0, 0)
         
         search_label = QLabel('Search')
-        search_label.setFont(QFont('Segoe UI', 10, QFont.Weight.Bold))
+        search_label.setFont(ui_font(10, bold=True))
         
         self.search_input = LineEdit()
         self.search_input.setPlaceholderText('Search playlists...')
-        self.search_input.textChanged.connect(self.filter_playlists)
+        
+        # Restarted on every keystroke, so a burst of typing filters once
+        self._filter_timer = QTimer(self)
+        self._filter_timer.setSingleShot(True)
+        self._filter_timer.setInterval(Constants.SEARCH_DEBOUNCE_MS)
+        self._filter_timer.timeout.connect(self.filter_playlists)
+        self.search_input.textChanged.connect(lambda _text: self._filter_timer.start())
         
         search_layout.addWidget(search_label)
         search_layout.addWidget(self.search_input)
@@ -1216,7 +1564,7 @@ class MainWindow(QMainWindow):
         sort_layout.setContentsMargins(0, 0, 0, 0)
         
         sort_label = QLabel('Sort By')
-        sort_label.setFont(QFont('Segoe UI', 10, QFont.Weight.Bold))
+        sort_label.setFont(ui_font(10, bold=True))
         
         self.sort_combo = ComboBox()
         self.sort_combo.addItems(['Name (A-Z)', 'Name (Z-A)', 'Most Tracks', 'Least Tracks'])
@@ -1243,10 +1591,10 @@ class MainWindow(QMainWindow):
         header_layout = QHBoxLayout()
         
         section_title = QLabel('Your Playlists')
-        section_title.setFont(QFont('Segoe UI', 14, QFont.Weight.Bold))
+        section_title.setFont(ui_font(14, bold=True))
         
         self.playlist_count_label = QLabel('0 playlists')
-        self.playlist_count_label.setStyleSheet(f"color: {Constants.TEXT_SECONDARY};")
+        self.playlist_count_label.setObjectName("SecondaryLabel")
         
         select_layout = QHBoxLayout()
         select_layout.setSpacing(5)
@@ -1267,7 +1615,12 @@ class MainWindow(QMainWindow):
         
         self.playlist_list = ListWidget()
         self.playlist_list.setSelectionMode(QListWidget.SelectionMode.MultiSelection)
-        self.playlist_list.itemSelectionChanged.connect(self.update_selection_count)
+        # Every row is one line, so Qt can lay out rows from a single size
+        # and in batches instead of measuring the whole library up front
+        self.playlist_list.setUniformItemSizes(True)
+        self.playlist_list.setLayoutMode(QListWidget.LayoutMode.Batched)
+        self.playlist_list.setBatchSize(100)
+        self.playlist_list.selectionModel().selectionChanged.connect(self.on_selection_changed)
         
         layout.addLayout(header_layout)
         layout.addWidget(self.playlist_list)
@@ -1281,7 +1634,7 @@ class MainWindow(QMainWindow):
         layout.setSpacing(20)
         
         title = QLabel('Export Options')
-        title.setFont(QFont('Segoe UI', 14, QFont.Weight.Bold))
+        title.setFont(ui_font(14, bold=True))
         
         location_container = QWidget()
         location_layout = QVBoxLayout(location_container)
@@ -1289,7 +1642,7 @@ class MainWindow(QMainWindow):
         location_layout.setContentsMargins(0, 0, 0, 0)
         
         location_label = QLabel('Export Location')
-        location_label.setFont(QFont('Segoe UI', 11, QFont.Weight.Bold))
+        location_label.setFont(ui_font(11, bold=True))
         
         location_input_layout = QHBoxLayout()
         self.location_input = LineEdit()
@@ -1314,7 +1667,7 @@ class MainWindow(QMainWindow):
         webhook_layout.setContentsMargins(0, 0, 0, 0)
         
         webhook_label = QLabel('Discord Webhook (optional)')
-        webhook_label.setFont(QFont('Segoe UI', 11, QFont.Weight.Bold))
+        webhook_label.setFont(ui_font(11, bold=True))
         
         self.webhook_input = LineEdit()
         self.webhook_input.setPlaceholderText('Paste webhook URL for Discord export')
@@ -1323,7 +1676,7 @@ class MainWindow(QMainWindow):
         webhook_layout.addWidget(self.webhook_input)
         
         format_label = QLabel('Select Export Format')
-        format_label.setFont(QFont('Segoe UI', 11, QFont.Weight.Bold))
+        format_label.setFont(ui_font(11, bold=True))
         
         formats_layout = QHBoxLayout()
         formats_layout.setSpacing(12)
@@ -1366,7 +1719,7 @@ class MainWindow(QMainWindow):
         controls_layout = QHBoxLayout()
         
         self.progress_label = QLabel('')
-        self.progress_label.setStyleSheet(f"color: {Constants.TEXT_SECONDARY};")
+        self.progress_label.setObjectName("SecondaryLabel")
         self.progress_label.setVisible(False)
         
         self.cancel_btn = PushButton('Cancel')
@@ -1382,95 +1735,137 @@ class MainWindow(QMainWindow):
         
         return container
     
-    def load_playlists(self):
-        try:
-            self.status_bar.showMessage('Loading playlists...')
-            self.playlists.clear()
-            self.playlist_list.clear()
-            
-            results = self.sp.current_user_playlists()
-            while results:
-                for item in results['items']:
-                    playlist = Playlist(
-                        id=item['id'],
-                        name=item['name'],
-                        track_count=item['tracks']['total'],
-                        owner=item['owner']['display_name'],
-                        description=item.get('description', '')
-                    )
-                    self.playlists.append(playlist)
-                    
-                    list_item = QListWidgetItem(f"{playlist.name} • {playlist.track_count} tracks")
-                    list_item.setToolTip(
-                        f"Owner: {playlist.owner}\n"
-                        f"Tracks: {playlist.track_count}\n"
-                        f"Description: {playlist.description or 'No description'}"
-                    )
-                    self.playlist_list.addItem(list_item)
-                
-                if results['next']:
-                    results = self.sp.next(results)
-                else:
-                    break
-            
-            self.update_playlist_count()
-            self.status_bar.showMessage(f'Loaded {len(self.playlists)} playlists', 3000)
-            logger.info(f"Loaded {len(self.playlists)} playlists")
-            
-        except Exception as e:
-            logger.exception("Failed to load playlists")
-            QMessageBox.critical(self, 'Error', f'Failed to load playlists:\n\n{str(e)}')
-            self.status_bar.showMessage('Failed to load playlists')
+    def load_playlists(self, refresh: bool = False):
+        if self.loader and self.loader.isRunning():
+            return
+        
+        self.status_bar.showMessage('Loading playlists...')
+        self.refresh_btn.setEnabled(False)
+        
+        # Pages are fetched off the GUI thread; the list is filled in once
+        # the whole library has arrived
+        self.loader = PlaylistLoader(self.sp, self.playlist_cache, refresh=refresh)
+        self.loader.loaded.connect(self.playlists_loaded)
+        self.loader.error.connect(self.playlists_load_error)
+        self.loader.start()
+    
+    def playlists_loaded(self, playlists: List[Playlist]):
+        self.refresh_btn.setEnabled(True)
+        self.playlists = playlists
+        self.populate_playlist_list()
+        
+        # Tracks of replaced snapshots can never be hit again, so the cache
+        # is kept to the playlists that are currently in the library.
+        # list() copies the keys in one step while an export may add more.
+        live_keys = {(p.id, p.snapshot_id) for p in playlists}
+        for key in list(self.track_cache):
+            if key not in live_keys:
+                self.track_cache.pop(key, None)
+        
+        self.update_playlist_count()
+        self.status_bar.showMessage(f'Loaded {len(self.playlists)} playlists', 3000)
+        logger.info("Loaded %s playlists", len(self.playlists))
+    
+    def playlists_load_error(self, error_message: str):
+        self.refresh_btn.setEnabled(True)
+        QMessageBox.critical(self, 'Error', f'Failed to load playlists:\n\n{error_message}')
+        self.status_bar.showMessage('Failed to load playlists')
     
     def filter_playlists(self):
         search_text = self.search_input.text().lower()
         
-        for i in range(self.playlist_list.count()):
-            item = self.playlist_list.item(i)
-            playlist = self.playlists[i]
-            
-            visible = (
-                search_text in playlist.name.lower() or
-                search_text in playlist.owner.lower() or
-                search_text in playlist.description.lower()
-            )
-            
-            item.setHidden(not visible)
+        candidates, matches = _narrow_filter(
+            self.playlists, search_text, self._filter_text, self._filter_matches
+        )
+        
+        visible = set(matches)
+        for i in candidates:
+            self.playlist_list.item(i).setHidden(i not in visible)
+                
+        self._filter_text = search_text
+        self._filter_matches = matches
     
     def sort_playlists(self):
         sort_type = self.sort_combo.currentIndex()
         
+        # Rows still match the old order here; ids survive the re-sort and
+        # give O(1) lookups when the selection is restored
+        selected_ids = {self.playlists[item.data(Qt.ItemDataRole.UserRole)].id
+                        for item in self.playlist_list.selectedItems()}
+        
         if sort_type == 0:  # Name A-Z
-            self.playlists.sort(key=lambda p: p.name.lower())
+            self.playlists.sort(key=attrgetter('name_lower'))
         elif sort_type == 1:  # Name Z-A
-            self.playlists.sort(key=lambda p: p.name.lower(), reverse=True)
+            self.playlists.sort(key=attrgetter('name_lower'), reverse=True)
         elif sort_type == 2:  # Most tracks
-            self.playlists.sort(key=lambda p: p.track_count, reverse=True)
+            self.playlists.sort(key=attrgetter('track_count'), reverse=True)
         elif sort_type == 3:  # Least tracks
-            self.playlists.sort(key=lambda p: p.track_count)
-        
-        selected_names = [self.playlists[self.playlist_list.row(item)].name 
-                         for item in self.playlist_list.selectedItems()]
-        
-        self.playlist_list.clear()
-        for playlist in self.playlists:
-            list_item = QListWidgetItem(f"{playlist.name} • {playlist.track_count} tracks")
-            list_item.setToolTip(
-                f"Owner: {playlist.owner}\n"
-                f"Tracks: {playlist.track_count}\n"
-                f"Description: {playlist.description or 'No description'}"
-            )
-            
-            if playlist.name in selected_names:
-                list_item.setSelected(True)
+            self.playlists.sort(key=attrgetter('track_count'))
+        
+        self.populate_playlist_list(selected_ids)
+    
+    def populate_playlist_list(self, selected_ids: Optional[Set[str]] = None):
+        """Rebuild the list rows from self.playlists in one pass"""
+        items = []
+        for index, playlist in enumerate(self.playlists):
+            list_item = QListWidgetItem(playlist.display)
+            list_item.setToolTip(playlist.tooltip)
+            # QListWidget.row() is a linear scan, so items carry their index
+            list_item.setData(Qt.ItemDataRole.UserRole, index)
+            items.append(list_item)
+        
+        # Repainting and selection signals are held back until every row is
+        # in, so the list lays out once instead of once per row
+        selection_model = self.playlist_list.selectionModel()
+        self.playlist_list.setUpdatesEnabled(False)
+        self.playlist_list.blockSignals(True)
+        selection_model.blockSignals(True)
+        try:
+            self.playlist_list.clear()
+            # Clearing resets the selection without reporting it
+            self._selected_count = 0
+            for playlist, list_item in zip(self.playlists, items):
+                self.playlist_list.addItem(list_item)
+                # Items can only be selected once they belong to the list
+                if selected_ids and playlist.id in selected_ids:
+                    list_item.setSelected(True)
+                    self._selected_count += 1
+        finally:
+            selection_model.blockSignals(False)
+            self.playlist_list.blockSignals(False)
+            self.playlist_list.setUpdatesEnabled(True)
+        
+        # Fresh rows are all visible, as if nothing had been searched yet
+        self._filter_text = ''
+        self._filter_matches = range(len(items))
             
-            self.playlist_list.addItem(list_item)
+        self.update_selection_count()
     
     def select_all_playlists(self):
-        for i in range(self.playlist_list.count()):
-            item = self.playlist_list.item(i)
-            if not item.isHidden():
-                item.setSelected(True)
+        # A search typed within the debounce window has not been applied yet;
+        # apply it now so only the rows about to stay visible get selected
+        if self._filter_timer.isActive():
+            self._filter_timer.stop()
+            self.filter_playlists()
+        
+        # The visible rows are exactly the last filter matches; each run of
+        # consecutive rows becomes one range of a single selection change
+        selection = QItemSelection()
+        model = self.playlist_list.model()
+        start = prev = None
+        for row in self._filter_matches:
+            if start is None:
+                start = row
+            elif row != prev + 1:
+                selection.select(model.index(start, 0), model.index(prev, 0))
+                start = row
+            prev = row
+        if start is not None:
+            selection.select(model.index(start, 0), model.index(prev, 0))
+        
+        self.playlist_list.selectionModel().select(
+            selection, QItemSelectionModel.SelectionFlag.Select
+        )
     
     def deselect_all_playlists(self):
         self.playlist_list.clearSelection()
@@ -1479,8 +1874,16 @@ class MainWindow(QMainWindow):
         total = len(self.playlists)
         self.playlist_count_label.setText(f'{total} playlist{"s" if total != 1 else ""}')
     
+    def on_selection_changed(self, selected: QItemSelection, deselected: QItemSelection):
+        # Only the rows that changed are reported, so the count is kept
+        # up to date without materialising the whole selection
+        self._selected_count += (
+            sum(r.height() for r in selected) - sum(r.height() for r in deselected)
+        )
+        self.update_selection_count()
+    
     def update_selection_count(self):
-        selected = len(self.playlist_list.selectedItems())
+        selected = self._selected_count
         if selected > 0:
             self.status_bar.showMessage(f'{selected} playlist{"s" if selected != 1 else ""} selected')
         else:
@@ -1515,10 +1918,10 @@ class MainWindow(QMainWindow):
         else:
             webhook_url = ""
         
-        selected_playlists = []
-        for item in selected_items:
-            index = self.playlist_list.row(item)
-            selected_playlists.append(self.playlists[index])
+        selected_playlists = [
+            self.playlists[item.data(Qt.ItemDataRole.UserRole)]
+            for item in selected_items
+        ]
         
         total_tracks = sum(p.track_count for p in selected_playlists)
         response = QMessageBox.question(
@@ -1540,15 +1943,19 @@ class MainWindow(QMainWindow):
             playlists=selected_playlists,
             sp=self.sp,
             output_dir=export_location,
-            webhook_url=webhook_url
+            webhook_url=webhook_url,
+            compress_json=self.config_manager.get_bool_setting('compress_json'),
+            track_cache=self.track_cache
         )
         
         self.worker.progress.connect(self.update_progress)
         self.worker.finished.connect(self.export_finished)
         self.worker.error.connect(self.export_error)
+        self.worker.cancelled.connect(self.export_cancelled)
+        self._export_active = True
         self.worker.start()
         
-        logger.info(f"Started export: {len(selected_playlists)} playlists to {export_format.value}")
+        logger.info("Started export: %s playlists to %s", len(selected_playlists), export_format.value)
     
     def show_progress(self, show: bool):
         self.progress_bar.setVisible(show)
@@ -1571,9 +1978,14 @@ class MainWindow(QMainWindow):
         self.progress_label.setText(message)
         self.status_bar.showMessage(message)
     
-    def export_finished(self, exported_files: List[str]):
+    def export_stopped(self):
+        self._export_active = False
         self.show_progress(False)
+        self.cancel_btn.setEnabled(True)
         self.enable_export_buttons()
+    
+    def export_finished(self, exported_files: List[str]):
+        self.export_stopped()
         
         if exported_files:
             file_list = '\n'.join([f'• {Path(f).name}' for f in exported_files[:10]])
@@ -1589,16 +2001,15 @@ class MainWindow(QMainWindow):
             QMessageBox.information(self, 'Export Complete', 'Export completed successfully!')
         
         self.status_bar.showMessage('Export completed', 5000)
-        logger.info(f"Export completed: {len(exported_files)} files")
+        logger.info("Export completed: %s files", len(exported_files))
     
     def export_error(self, error_message: str):
-        self.show_progress(False)
-        self.enable_export_buttons()
+        self.export_stopped()
         
         QMessageBox.critical(self, 'Export Failed', f'An error occurred during export:\n\n{error_message}')
         
         self.status_bar.showMessage('Export failed')
-        logger.error(f"Export failed: {error_message}")
+        logger.error("Export failed: %s", error_message)
     
     def cancel_export(self):
         if self.worker and self.worker.isRunning():
@@ -1609,12 +2020,19 @@ class MainWindow(QMainWindow):
                 QMessageBox.StandardButton.Yes | QMessageBox.StandardButton.No
             )
             
-            if response == QMessageBox.StandardButton.Yes:
+            # The run may have ended while the question was open
+            if response == QMessageBox.StandardButton.Yes and self._export_active:
                 self.worker.cancel()
-                self.show_progress(False)
-                self.enable_export_buttons()
-                self.status_bar.showMessage('Export cancelled')
-                logger.info("Export cancelled by user")
+                # Exports stay disabled until the worker reports it has
+                # stopped, so two workers never share the track cache
+                self.cancel_btn.setEnabled(False)
+                self.progress_label.setText('Cancelling...')
+                self.status_bar.showMessage('Cancelling export...')
+    
+    def export_cancelled(self):
+        self.export_stopped()
+        self.status_bar.showMessage('Export cancelled')
+        logger.info("Export cancelled by user")
     
     def show_settings(self):
         dialog = SettingsDialog(self.config_manager, self)
@@ -1625,12 +2043,84 @@ class MainWindow(QMainWindow):
 
 
 # ==================== Main Application ====================
+def create_spotify_client(credentials: Dict[str, str]) -> 'spotipy.Spotify':
+    # spotipy is only imported once there are credentials to use it with,
+    # so the login window comes up without paying for it
+    import spotipy
+    from spotipy.oauth2 import SpotifyOAuth
+    
+    auth_manager = SpotifyOAuth(
+        client_id=credentials['client_id'],
+        client_secret=credentials['client_secret'],
+        redirect_uri=Constants.REDIRECT_URI,
+        scope=Constants.SPOTIFY_SCOPE
+    )
+    return spotipy.Spotify(auth_manager=auth_manager)
+
+
+class SpotifyClientLoader(QThread):
+    """Worker thread that creates the client and makes sure it has a valid token"""
+    ready = pyqtSignal(object)
+    # Spotify rejected the saved credentials or refresh token
+    auth_failed = pyqtSignal(str)
+    # Anything else, e.g. no network; the saved credentials are still valid
+    error = pyqtSignal(str)
+    
+    # OAuth error codes that mean signing in again is the only way forward
+    AUTH_ERRORS = ('invalid_client', 'invalid_grant')
+    
+    def __init__(self, credentials: Dict[str, str]):
+        super().__init__()
+        self.credentials = credentials
+        
+    def run(self):
+        from spotipy.oauth2 import SpotifyOauthError
+        
+        auth_manager = None
+        try:
+            sp = create_spotify_client(self.credentials)
+            # Refreshing a saved token is a network round-trip, so it is done
+            # here instead of on the first call made from the GUI thread.
+            # Without a cached token the interactive authorization flow would
+            # start instead, which must not run behind the splash screen.
+            auth_manager = sp.auth_manager
+            token_info = auth_manager.cache_handler.get_cached_token()
+            if token_info:
+                auth_manager.validate_token(token_info)
+            self.ready.emit(sp)
+        except SpotifyOauthError as e:
+            logger.exception("Failed to authenticate with saved credentials")
+            if getattr(e, 'error', None) in self.AUTH_ERRORS:
+                # A rejected refresh token would be read back by the next
+                # client and fail again, so the login has to start clean
+                if auth_manager is not None:
+                    self.discard_cached_token(auth_manager)
+                self.auth_failed.emit(getattr(e, 'error_description', None) or str(e))
+            else:
+                self.error.emit(str(e))
+        except Exception as e:
+            logger.exception("Failed to connect to Spotify")
+            self.error.emit(str(e))
+    
+    @staticmethod
+    def discard_cached_token(auth_manager: 'spotipy.SpotifyOAuth'):
+        """Delete spotipy's token cache file, if the cache handler keeps one"""
+        cache_path = getattr(auth_manager.cache_handler, 'cache_path', None)
+        if not cache_path:
+            return
+        try:
+            Path(cache_path).unlink(missing_ok=True)
+        except OSError as e:
+            logger.warning("Failed to delete token cache %s: %s", cache_path, e)
+
+
 def main():
     """Main application entry point"""
     app = QApplication(sys.argv)
     app.setApplicationName(Constants.APP_NAME)
     app.setApplicationVersion(Constants.APP_VERSION)
-    app.setFont(QFont('Segoe UI', 10))
+    app.setFont(ui_font(10))
+    app.setStyleSheet(build_stylesheet())
     
 
     config_manager = ConfigManager()
@@ -1639,44 +2129,14 @@ def main():
     setTheme(Theme.DARK)
     setThemeColor(Constants.PRIMARY)
 
-    
-    def create_spotify_client(credentials: Dict[str, str]) -> spotipy.Spotify:
-        auth_manager = SpotifyOAuth(
-            client_id=credentials['client_id'],
-            client_secret=credentials['client_secret'],
-            redirect_uri=Constants.REDIRECT_URI,
-            scope=Constants.SPOTIFY_SCOPE
-        )
-        return spotipy.Spotify(auth_manager=auth_manager)
-    
     # Keep global references to prevent garbage collection
     windows = {}
     
-    def show_main_window(sp: spotipy.Spotify):
+    def show_main_window(sp: 'spotipy.Spotify'):
         windows['main'] = MainWindow(sp)
         windows['main'].show()
     
-    credentials = config_manager.load_credentials()
-    
-    if credentials:
-        try:
-            sp = create_spotify_client(credentials)
-            show_main_window(sp)
-        except Exception as e:
-            logger.exception("Failed to authenticate with saved credentials")
-            if Path(Constants.CONFIG_FILE).exists():
-                Path(Constants.CONFIG_FILE).unlink()
-            
-            windows['login'] = LoginWindow()
-            
-            def on_login_success():
-                credentials = config_manager.load_credentials()
-                sp = create_spotify_client(credentials)
-                show_main_window(sp)
-            
-            windows['login'].login_successful.connect(on_login_success)
-            windows['login'].show()
-    else:
+    def show_login_window():
         windows['login'] = LoginWindow()
         
         def on_login_success():
@@ -1687,6 +2147,61 @@ def main():
         windows['login'].login_successful.connect(on_login_success)
         windows['login'].show()
     
+    credentials = config_manager.load_credentials()
+    
+    if credentials:
+        splash_pixmap = QPixmap(360, 120)
+        splash_pixmap.fill(QColor(Constants.SURFACE))
+        splash = QSplashScreen(splash_pixmap)
+        splash.showMessage(
+            'Connecting to Spotify...',
+            Qt.AlignmentFlag.AlignCenter,
+            QColor(Constants.TEXT_PRIMARY)
+        )
+        splash.show()
+        
+        def start_client_loader():
+            # The event loop keeps running while the saved token is refreshed
+            windows['client_loader'] = SpotifyClientLoader(credentials)
+            windows['client_loader'].ready.connect(on_client_ready)
+            windows['client_loader'].auth_failed.connect(on_client_auth_failed)
+            windows['client_loader'].error.connect(on_client_error)
+            windows['client_loader'].start()
+        
+        def on_client_ready(sp: 'spotipy.Spotify'):
+            show_main_window(sp)
+            splash.finish(windows['main'])
+        
+        def on_client_auth_failed(error_message: str):
+            QMessageBox.warning(
+                splash,
+                'Sign In Required',
+                f'Spotify rejected the saved sign-in:\n\n{error_message}\n\n'
+                'Please log in again.'
+            )
+            splash.close()
+            config_manager.clear_credentials()
+            show_login_window()
+        
+        def on_client_error(error_message: str):
+            # Usually a network problem, so the saved credentials are kept.
+            # The splash stays up as the dialog's parent, so the application
+            # always has a visible window while the user decides.
+            response = QMessageBox.warning(
+                splash,
+                'Connection Failed',
+                f'Could not connect to Spotify:\n\n{error_message}',
+                QMessageBox.StandardButton.Retry | QMessageBox.StandardButton.Close
+            )
+            if response == QMessageBox.StandardButton.Retry:
+                start_client_loader()
+            else:
+                app.quit()
+        
+        start_client_loader()
+    else:
+        show_login_window()
+    
     sys.exit(app.exec())
 
 
@@ -0,0 +1,68 @@
+"""
+Shared fakes for the ExportWorker tests
+"""
+
+import tempfile
+import threading
+import time
+from concurrent.futures import ThreadPoolExecutor
+
+import spotify_exporter
+from spotify_exporter import ExportFormat, ExportWorker
+
+
+PAGE_SIZE = spotify_exporter.Constants.TRACK_PAGE_SIZE
+
+
+def make_item(index):
+    return {'track': {
+        'name': f"Track {index}",
+        'id': f"id{index}",
+        'duration_ms': 1000 + index,
+        'external_urls': {'spotify': f"https://open.spotify.com/track/id{index}"},
+        'artists': [{'name': f"Artist {index % 3}"}],
+        'album': {'name': f"Album {index % 5}"},
+    }}
+
+
+class FakeSpotify:
+    """Serves a playlist of `total` tracks, answering later pages first"""
+
+    def __init__(self, total, fail_offset=None, on_last_page=None, snapshot_id='snap'):
+        self.total = total
+        self.snapshot_id = snapshot_id
+        self.fail_offset = fail_offset
+        self.on_last_page = on_last_page
+        self.calls = 0
+        self._lock = threading.Lock()
+
+    def playlist(self, playlist_id, fields=None):
+        return {'snapshot_id': self.snapshot_id}
+
+    def playlist_items(self, playlist_id, limit=100, fields=None, offset=0,
+                       additional_types=None):
+        with self._lock:
+            self.calls += 1
+        if offset == self.fail_offset:
+            raise RuntimeError(f"page at {offset} failed")
+        # Earlier offsets sleep longer, so pages complete out of order
+        if offset:
+            time.sleep(0.002 * (self.total - offset) / limit)
+        end = min(offset + limit, self.total)
+        if end == self.total and self.on_last_page:
+            self.on_last_page()
+        return {
+            'total': self.total,
+            'items': [make_item(i) for i in range(offset, end)],
+        }
+
+
+def make_worker(testcase, sp, track_cache=None):
+    """Return an ExportWorker with a page pool that is shut down after the test"""
+    worker = ExportWorker(
+        ExportFormat.CSV, [], sp, tempfile.gettempdir(), track_cache=track_cache
+    )
+    executor = ThreadPoolExecutor(max_workers=4)
+    testcase.addCleanup(executor.shutdown)
+    worker._page_executor = executor
+    return worker
@@ -0,0 +1,52 @@
+"""
+Tests for the order and look-ahead of ExportWorker.run()
+"""
+
+import tempfile
+import threading
+import time
+import unittest
+
+from spotify_exporter import Constants, ExportFormat, ExportWorker, Playlist, Track
+
+
+class ExportRunTests(unittest.TestCase):
+
+    def setUp(self):
+        self.playlists = [Playlist(str(i), f"Playlist {i}", 1, 'owner') for i in range(20)]
+        self.worker = ExportWorker(ExportFormat.CSV, self.playlists, None, tempfile.gettempdir())
+        self.loaded = []
+        self.written = []
+        self.errors = []
+        self.worker.error.connect(self.errors.append)
+        self.lock = threading.Lock()
+        self.worker.load_tracks = self.load_tracks
+
+    def load_tracks(self, playlist):
+        with self.lock:
+            self.loaded.append(playlist.id)
+        time.sleep(0.005)
+        return [Track("Name", "Artist", "Album", 1000, "url")]
+
+    def test_playlists_are_written_in_order(self):
+        self.worker._exporter = lambda playlist, tracks: self.written.append(playlist.id)
+
+        self.worker.run()
+
+        self.assertEqual(self.written, [p.id for p in self.playlists])
+        self.assertEqual(self.errors, [])
+
+    def test_failed_export_stops_fetching_ahead(self):
+        def fail(playlist, tracks):
+            raise OSError("disk full")
+        self.worker._exporter = fail
+
+        self.worker.run()
+
+        self.assertEqual(self.errors, ["disk full"])
+        # Only the look-ahead was ever queued, plus the one refilled before writing
+        self.assertLessEqual(len(self.loaded), Constants.PLAYLIST_LOOKAHEAD + 1)
+
+
+if __name__ == '__main__':
+    unittest.main()
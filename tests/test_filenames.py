@@ -0,0 +1,59 @@
+"""
+Tests for turning playlist names into export file names
+"""
+
+import tempfile
+import unittest
+from pathlib import Path
+
+from spotify_exporter import ExportFormat, ExportWorker, Playlist
+
+
+class SanitizeFilenameTests(unittest.TestCase):
+
+    def test_reserved_characters_are_removed(self):
+        self.assertEqual(ExportWorker.sanitize_filename('a<b>c:d"e/f\\g|h?i*j'), 'abcdefghij')
+
+    def test_control_characters_are_removed(self):
+        self.assertEqual(ExportWorker.sanitize_filename('a\x00b\x1fc\x7fd\x9fe'), 'abcde')
+
+    def test_leading_and_trailing_dots_and_spaces_are_stripped(self):
+        self.assertEqual(ExportWorker.sanitize_filename(' .My Mix. '), 'My Mix')
+
+    def test_other_characters_are_kept(self):
+        self.assertEqual(ExportWorker.sanitize_filename('Café – 夜 🎧'), 'Café – 夜 🎧')
+
+    def test_empty_result_falls_back(self):
+        self.assertEqual(ExportWorker.sanitize_filename('???'), 'playlist')
+
+    def test_long_names_are_truncated(self):
+        self.assertEqual(len(ExportWorker.sanitize_filename('x' * 300)), 200)
+
+
+class BuildFilenameTests(unittest.TestCase):
+
+    def test_same_named_playlists_get_distinct_paths(self):
+        worker = ExportWorker(ExportFormat.CSV, [], None, tempfile.gettempdir())
+        worker._ts_compact = '20240101_120000'
+
+        first = worker._build_filename(Playlist('1', 'Favorites', 1, 'a'), 'csv')
+        second = worker._build_filename(Playlist('2', 'Favorites', 1, 'b'), 'csv')
+        third = worker._build_filename(Playlist('3', 'Favorites', 1, 'c'), 'csv')
+
+        self.assertEqual(Path(first).name, 'Favorites_20240101_120000.csv')
+        self.assertEqual(Path(second).name, 'Favorites_20240101_120000_2.csv')
+        self.assertEqual(Path(third).name, 'Favorites_20240101_120000_3.csv')
+
+    def test_names_differing_only_in_case_get_distinct_paths(self):
+        worker = ExportWorker(ExportFormat.CSV, [], None, tempfile.gettempdir())
+        worker._ts_compact = '20240101_120000'
+
+        first = worker._build_filename(Playlist('1', 'Chill', 1, 'a'), 'csv')
+        second = worker._build_filename(Playlist('2', 'chill', 1, 'b'), 'csv')
+
+        self.assertEqual(Path(first).name, 'Chill_20240101_120000.csv')
+        self.assertEqual(Path(second).name, 'chill_20240101_120000_2.csv')
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,79 @@
+"""
+Tests for the on-disk playlist listing cache
+"""
+
+import json
+import tempfile
+import time
+import unittest
+from pathlib import Path
+
+from spotify_exporter import Playlist, PlaylistCache
+
+
+class PlaylistCacheTests(unittest.TestCase):
+
+    def setUp(self):
+        directory = tempfile.TemporaryDirectory()
+        self.addCleanup(directory.cleanup)
+        self.path = Path(directory.name) / 'nested' / 'playlists.json'
+        self.cache = PlaylistCache(self.path, ttl=600)
+        self.playlists = [
+            Playlist('1', 'Road Trip', 10, 'Alice', 'Summer', snapshot_id='s1'),
+            Playlist('2', 'Focus', 3, 'Bob'),
+        ]
+
+    def test_round_trip(self):
+        self.cache.set('user', self.playlists)
+
+        loaded = self.cache.get('user')
+
+        self.assertEqual(loaded, self.playlists)
+        self.assertEqual(loaded[0].snapshot_id, 's1')
+        self.assertEqual(loaded[0].search_blob, self.playlists[0].search_blob)
+
+    def test_users_are_kept_apart(self):
+        self.cache.set('user', self.playlists)
+        self.cache.set('other', self.playlists[:1])
+
+        self.assertEqual(len(self.cache.get('user')), 2)
+        self.assertEqual(len(self.cache.get('other')), 1)
+        self.assertIsNone(self.cache.get('nobody'))
+
+    def test_expired_entry_is_a_miss(self):
+        self.cache.set('user', self.playlists)
+        data = json.loads(self.path.read_text(encoding='utf-8'))
+        data['user']['saved_at'] -= 601
+        self.path.write_text(json.dumps(data), encoding='utf-8')
+
+        self.assertIsNone(self.cache.get('user'))
+
+    def test_missing_file_is_a_miss(self):
+        self.assertIsNone(self.cache.get('user'))
+
+    def test_unparseable_file_is_a_miss(self):
+        self.path.parent.mkdir(parents=True)
+        self.path.write_text('{"user": {"saved_at": ', encoding='utf-8')
+
+        self.assertIsNone(self.cache.get('user'))
+        self.cache.set('user', self.playlists)
+        self.assertEqual(self.cache.get('user'), self.playlists)
+
+    def test_malformed_entries_are_a_miss(self):
+        self.path.parent.mkdir(parents=True)
+        now = time.time()
+        for data in [
+            [],
+            {'user': []},
+            {'user': {'saved_at': 'yesterday', 'playlists': []}},
+            {'user': {'saved_at': now}},
+            {'user': {'saved_at': now, 'playlists': [['1', 'too few']]}},
+            {'user': {'saved_at': now, 'playlists': [[1, 2, 3, 4, 5, 6]]}},
+        ]:
+            with self.subTest(data=data):
+                self.path.write_text(json.dumps(data), encoding='utf-8')
+                self.assertIsNone(self.cache.get('user'))
+
+
+if __name__ == '__main__':
+    unittest.main()
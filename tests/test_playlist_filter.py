@@ -0,0 +1,62 @@
+"""
+Tests for searching the playlist list
+"""
+
+import unittest
+
+from spotify_exporter import Playlist, _narrow_filter
+
+
+class PlaylistSearchTests(unittest.TestCase):
+
+    def test_search_blob_is_lowercase(self):
+        playlist = Playlist('1', 'Road Trip', 10, 'Alice', 'Summer HITS')
+
+        self.assertIn('road trip', playlist.search_blob)
+        self.assertIn('alice', playlist.search_blob)
+        self.assertIn('summer hits', playlist.search_blob)
+
+    def test_search_cannot_match_across_fields(self):
+        playlist = Playlist('1', 'ab', 10, 'cd', 'ef')
+
+        self.assertNotIn('bc', playlist.search_blob)
+        self.assertNotIn('de', playlist.search_blob)
+
+
+class NarrowFilterTests(unittest.TestCase):
+
+    def setUp(self):
+        self.playlists = [
+            Playlist(str(i), name, 1, 'owner')
+            for i, name in enumerate(['rock', 'rock classics', 'jazz', 'rocksteady', 'pop rock'])
+        ]
+
+    def full_scan(self, search_text):
+        return [i for i, p in enumerate(self.playlists) if search_text in p.search_blob]
+
+    def test_extended_search_only_retests_previous_matches(self):
+        _, previous = _narrow_filter(self.playlists, 'ro', '', range(len(self.playlists)))
+
+        candidates, matches = _narrow_filter(self.playlists, 'rock', 'ro', previous)
+
+        self.assertEqual(list(candidates), previous)
+        self.assertEqual(matches, self.full_scan('rock'))
+
+    def test_unrelated_search_rescans_every_row(self):
+        _, previous = _narrow_filter(self.playlists, 'rock', '', range(len(self.playlists)))
+
+        candidates, matches = _narrow_filter(self.playlists, 'jazz', 'rock', previous)
+
+        self.assertEqual(list(candidates), list(range(len(self.playlists))))
+        self.assertEqual(matches, self.full_scan('jazz'))
+
+    def test_narrowing_matches_full_scan_while_typing(self):
+        last_text, last_matches = '', range(len(self.playlists))
+        for search_text in ['r', 'ro', 'roc', 'rock', 'rock ', 'rock', 'rocks', 'o', 'op']:
+            _, last_matches = _narrow_filter(self.playlists, search_text, last_text, last_matches)
+            last_text = search_text
+            self.assertEqual(last_matches, self.full_scan(search_text), search_text)
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,92 @@
+"""
+Tests for reusing fetched tracks across exports
+"""
+
+import unittest
+
+from spotify_exporter import Playlist
+
+from support import PAGE_SIZE, FakeSpotify, make_item, make_worker
+
+
+class TrackCacheTests(unittest.TestCase):
+
+    def test_complete_fetch_is_cached(self):
+        cache = {}
+        worker = make_worker(self, FakeSpotify(total=PAGE_SIZE * 2 + 1), cache)
+
+        tracks = worker.get_playlist_tracks('playlist', cache_key=('playlist', 'snap'))
+
+        self.assertEqual(len(tracks), PAGE_SIZE * 2 + 1)
+        self.assertIs(cache[('playlist', 'snap')], tracks)
+
+    def test_fetch_with_failed_page_is_not_cached(self):
+        cache = {}
+        sp = FakeSpotify(total=PAGE_SIZE * 3, fail_offset=PAGE_SIZE * 2)
+        worker = make_worker(self, sp, cache)
+
+        tracks = worker.get_playlist_tracks('playlist', cache_key=('playlist', 'snap'))
+
+        # The pages before the failure are still exported
+        self.assertEqual(len(tracks), PAGE_SIZE * 2)
+        self.assertEqual(cache, {})
+
+    def test_cancelled_fetch_is_not_cached(self):
+        cache = {}
+        sp = FakeSpotify(total=PAGE_SIZE * 2)
+        worker = make_worker(self, sp, cache)
+        sp.on_last_page = worker.cancel
+
+        worker.get_playlist_tracks('playlist', cache_key=('playlist', 'snap'))
+
+        self.assertEqual(cache, {})
+
+    def test_skipped_tracks_still_count_as_complete(self):
+        cache = {}
+        worker = make_worker(self, FakeSpotify(total=3), cache)
+        pages = [{'total': 3, 'items': [make_item(0), {'track': None}, make_item(2)]}]
+        worker.fetch_track_pages = lambda playlist_id: pages
+
+        tracks = worker.get_playlist_tracks('playlist', cache_key=('playlist', 'snap'))
+
+        self.assertEqual([t.name for t in tracks], ["Track 0", "Track 2"])
+        self.assertIn(('playlist', 'snap'), cache)
+
+    def test_load_tracks_reuses_cache_for_same_snapshot(self):
+        sp = FakeSpotify(total=5)
+        worker = make_worker(self, sp)
+        playlist = Playlist('playlist', 'Name', 5, 'owner', snapshot_id='snap')
+
+        first = worker.load_tracks(playlist)
+        calls = sp.calls
+        second = worker.load_tracks(playlist)
+
+        self.assertIs(first, second)
+        self.assertEqual(sp.calls, calls)
+
+        worker.load_tracks(Playlist('playlist', 'Name', 5, 'owner', snapshot_id='new'))
+        self.assertGreater(sp.calls, calls)
+
+    def test_load_tracks_refetches_when_snapshot_changed_since_listing(self):
+        cache = {}
+        sp = FakeSpotify(total=5)
+        worker = make_worker(self, sp, cache)
+        playlist = Playlist('playlist', 'Name', 5, 'owner', snapshot_id='snap')
+        first = worker.load_tracks(playlist)
+        calls = sp.calls
+
+        # The listing still reports the old snapshot
+        sp.snapshot_id = 'edited'
+        second = worker.load_tracks(playlist)
+
+        self.assertIsNot(first, second)
+        self.assertGreater(sp.calls, calls)
+        self.assertIs(cache[('playlist', 'edited')], second)
+
+        calls = sp.calls
+        self.assertIs(worker.load_tracks(playlist), second)
+        self.assertEqual(sp.calls, calls)
+
+
+if __name__ == '__main__':
+    unittest.main()
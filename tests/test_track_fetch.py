@@ -0,0 +1,31 @@
+"""
+Tests for fetching a playlist's track pages in parallel
+"""
+
+import unittest
+
+from support import PAGE_SIZE, FakeSpotify, make_worker
+
+
+class FetchTrackPagesTests(unittest.TestCase):
+
+    def test_pages_keep_offset_order(self):
+        worker = make_worker(self, FakeSpotify(total=PAGE_SIZE * 5 + 7))
+
+        pages = worker.fetch_track_pages('playlist')
+
+        names = [item['track']['name'] for page in pages for item in page['items']]
+        self.assertEqual(names, [f"Track {i}" for i in range(PAGE_SIZE * 5 + 7)])
+
+    def test_tracks_keep_playlist_order(self):
+        worker = make_worker(self, FakeSpotify(total=PAGE_SIZE * 3))
+
+        tracks = worker.get_playlist_tracks('playlist')
+
+        self.assertEqual([t.name for t in tracks], [f"Track {i}" for i in range(PAGE_SIZE * 3)])
+        self.assertEqual(tracks[4].artist, "Artist 1")
+        self.assertEqual(tracks[4].album, "Album 4")
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,40 @@
+"""
+Tests for turning playlist items into Track rows
+"""
+
+import unittest
+
+from support import FakeSpotify, make_item, make_worker
+
+
+class TrackParsingTests(unittest.TestCase):
+
+    def parse(self, items):
+        worker = make_worker(self, FakeSpotify(total=len(items)))
+        worker.fetch_track_pages = lambda playlist_id: [{'total': len(items), 'items': items}]
+        return worker.get_playlist_tracks('playlist')
+
+    def test_missing_fields_fall_back_to_defaults(self):
+        tracks = self.parse([{'track': {'id': 'abc', 'name': None, 'artists': [{}]}}])
+
+        self.assertEqual(len(tracks), 1)
+        self.assertEqual(tracks[0].name, "Unknown Track")
+        self.assertEqual(tracks[0].artist, "Unknown Artist")
+        self.assertEqual(tracks[0].duration_ms, 0)
+        self.assertEqual(tracks[0].url, "https://open.spotify.com/track/abc")
+
+    def test_malformed_entries_are_skipped(self):
+        tracks = self.parse([
+            make_item(0),
+            {'track': 'not a track'},
+            {'track': {'name': 'Bad album', 'album': 'string'}},
+            {'track': {'name': 'Bad urls', 'external_urls': ['list']}},
+            {'track': {'name': 'Bad artists', 'artists': 5}},
+            make_item(5),
+        ])
+
+        self.assertEqual([t.name for t in tracks], ["Track 0", "Track 5"])
+
+
+if __name__ == '__main__':
+    unittest.main()